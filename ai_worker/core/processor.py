@@ -23,7 +23,7 @@ from ai_worker.renderer.thumbnail import generate_thumbnail, get_thumbnail_path
 from ai_worker.tts.fish_client import synthesize as tts_synthesize
 from db.models import ScriptData
 from config.settings import MEDIA_DIR, load_pipeline_config, MAX_RETRY_COUNT
-from db.models import Content, Post, PostStatus
+from db.models import Comment, Content, Post, PostStatus
 from db.session import SessionLocal
 
 logger = logging.getLogger(__name__)
@@ -246,8 +246,14 @@ class RobustProcessor:
                 except Exception:
                     logger.debug("기존 summary_text JSON 파싱 실패 — 새로 생성")
 
-            # 베스트 댓글 추출
-            best_comments = sorted(post.comments, key=lambda c: c.likes, reverse=True)[:5]
+            # 베스트 댓글 추출 — 전체 댓글 로드 대신 DB에서 정렬·상위 5개만 조회
+            best_comments = (
+                session.query(Comment)
+                .filter(Comment.post_id == post.id)
+                .order_by(Comment.likes.desc())
+                .limit(5)
+                .all()
+            )
             comment_texts = [f"{c.author}: {c.content[:100]}" for c in best_comments]
 
             # 피드백 설정 로드 (feedback_config.json)
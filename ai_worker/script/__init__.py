@@ -1,4 +1,4 @@
-from ai_worker.script.client import generate_script, call_ollama_raw  # noqa: F401
+from ai_worker.script.client import generate_script, call_ollama_raw, call_ollama_stream  # noqa: F401
 from ai_worker.script.parser import parse_script_json  # noqa: F401
 from ai_worker.script.normalizer import ensure_comments, split_comment_lines  # noqa: F401
 from ai_worker.script.logger import LLMCallTimer, log_llm_call  # noqa: F401
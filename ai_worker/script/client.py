@@ -1,4 +1,6 @@
+import json
 import logging
+from collections.abc import Iterator
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -222,3 +224,53 @@ def call_ollama_raw(
     _model = model or OLLAMA_MODEL
     raw = _call_ollama(prompt, _model, num_predict=max_tokens, timeout=timeout)
     return raw
+
+
+def call_ollama_stream(
+    prompt: str,
+    model: str | None = None,
+    max_tokens: int = 512,
+    temperature: float = 0.5,
+    timeout: int = 120,
+) -> Iterator[str]:
+    """범용 Ollama 스트리밍 호출. 생성되는 토큰 조각을 순서대로 yield.
+
+    Ollama ``stream: true`` 응답(NDJSON 한 줄 = 조각 1개)을 그대로 흘려보내므로
+    전체 생성 완료 전에 부분 결과를 화면에 표시할 수 있다.
+
+    Args:
+        prompt: 프롬프트 전체 텍스트
+        model: Ollama 모델명 (None이면 기본값)
+        max_tokens: 최대 토큰 수
+        temperature: 샘플링 온도
+        timeout: 조각 간 읽기 타임아웃 (초, 기본 2분)
+
+    Yields:
+        응답 텍스트 조각
+    """
+    url = f"{get_ollama_host()}/api/generate"
+    payload = {
+        "model": model or OLLAMA_MODEL,
+        "prompt": prompt,
+        "stream": True,
+        "options": {"num_predict": max_tokens, "temperature": temperature},
+    }
+    try:
+        with _ollama_session.post(
+            url, json=payload, stream=True, timeout=(10, timeout),
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise ConnectionError(f"Ollama 오류: {chunk['error']}")
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+    except requests.Timeout:
+        raise TimeoutError(f"Ollama 응답 타임아웃 ({timeout}초 초과)")
+    except requests.RequestException as e:
+        raise ConnectionError(f"Ollama 연결 오류: {e}") from e
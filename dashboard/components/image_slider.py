@@ -2,11 +2,21 @@
 
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import requests
 import streamlit as st
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 log = logging.getLogger(__name__)
 
 _UA = (
@@ -21,8 +31,30 @@ _REFERER_MAP: dict[str, str] = {
     "dcinside.com": "https://gall.dcinside.com/",
 }
 
-# DCInside 전용 세션 (쿠키 워밍업 포함)
-_dc_session: requests.Session | None = None
+# 이미지 본문 최대 크기 (초과 시 다운로드 중단)
+_IMG_MAX_BYTES = 20_000_000
+_IMG_CHUNK_SIZE = 65536
+
+# 이미지 포맷 매직 바이트 (JPEG / PNG / GIF) — WEBP·AVIF는 _looks_like_image에서 별도 확인
+_IMG_MAGICS = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+# ISO-BMFF(ftyp) 중 이미지 브랜드 — MP4/MOV 등 동영상 브랜드는 제외
+_IMG_FTYP_BRANDS = (b"avif", b"avis", b"heic", b"heix", b"mif1", b"msf1")
+# 이 크기 미만의 GIF는 1×1 플레이스홀더로 간주 (1×1 GIF ≈ 43B)
+_PLACEHOLDER_GIF_MAX = 200
+
+# 이미지 바이트 LRU 캐시 (URL → (저장 시각, bytes|None)) — 항목 수·총 바이트 상한
+_IMG_CACHE_TTL = 300
+_IMG_CACHE_MAX_ENTRIES = 64
+_IMG_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_img_cache: "OrderedDict[str, tuple[float, bytes | None]]" = OrderedDict()
+_img_cache_bytes = 0
+_img_cache_lock = threading.Lock()
+
+# 인접 슬라이드 이미지 선로딩용 공유 풀 (◀/▶ 클릭 시 RTT 대기 제거)
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="img-prefetch")
+# 선로딩 진행 중인 URL (완료 콜백에서 제거)
+_prefetch_inflight: set[str] = set()
+_prefetch_lock = threading.Lock()
 
 
 def _get_referer(url: str) -> str:
@@ -41,29 +73,33 @@ def _is_dc_url(url: str) -> bool:
     return any(hostname.endswith(d) for d in ("dcinside.com", "dcinside.co.kr"))
 
 
+@st.cache_resource(show_spinner=False)
 def _get_dc_session() -> requests.Session:
-    """DCInside 이미지 다운로드용 세션 (쿠키 워밍업 포함).
+    """DCInside 이미지 다운로드용 세션 (쿠키 워밍업 포함, 프로세스당 1개).
 
     DCInside CDN은 쿠키 없이 요청하면 403/이미지 차단하는 경우가 있으므로
-    메인 페이지에서 세션 쿠키를 먼저 획득한다.
+    메인 페이지에서 세션 쿠키를 먼저 획득한다. 쿠키는 응답 헤더로만 받으면
+    되므로 본문 없는 HEAD 요청으로 워밍업한다 (첫 DC 이미지 요청 시점에 1회).
     """
-    global _dc_session
-    if _dc_session is not None:
-        return _dc_session
-    _dc_session = requests.Session()
-    _dc_session.headers.update({
+    sess = requests.Session()
+    sess.headers.update({
         "User-Agent": _UA,
         "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
     })
     try:
-        _dc_session.get("https://www.dcinside.com/", timeout=10)
-        log.debug(
-            "DCInside 이미지 세션 워밍업 OK (cookies=%d)",
-            len(_dc_session.cookies),
-        )
+        sess.head("https://www.dcinside.com/", allow_redirects=True, timeout=5)
+        log.debug("DCInside 이미지 세션 워밍업 OK (cookies=%d)", len(sess.cookies))
     except Exception:
         log.debug("DCInside 이미지 세션 워밍업 실패 — 쿠키 없이 시도")
-    return _dc_session
+    return sess
+
+
+@st.cache_resource(show_spinner=False)
+def _get_generic_session() -> requests.Session:
+    """일반 사이트 이미지 다운로드용 세션 (커넥션 재사용, 프로세스당 1개)."""
+    sess = requests.Session()
+    sess.headers.update({"User-Agent": _UA})
+    return sess
 
 
 def _safe_rerun_fragment() -> None:
@@ -74,41 +110,112 @@ def _safe_rerun_fragment() -> None:
         st.rerun()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+def _looks_like_image(head: bytes) -> bool:
+    """선두 12바이트 매직 넘버로 이미지 여부를 판별한다."""
+    if head.startswith(_IMG_MAGICS):
+        return True
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return True
+    return head[4:8] == b"ftyp" and head[8:12] in _IMG_FTYP_BRANDS  # AVIF/HEIF
+
+
+def _read_body(resp: requests.Response, url: str) -> bytes | None:
+    """스트리밍 응답 본문을 청크 단위로 읽는다 (resp.content 이중 버퍼링 회피).
+
+    Content-Length 또는 누적 크기가 ``_IMG_MAX_BYTES``를 넘으면 즉시 중단한다.
+    첫 청크의 매직 바이트가 이미지가 아니면(차단 시 HTML 에러 페이지 등)
+    나머지를 받지 않고 중단한다.
+    """
+    declared = resp.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > _IMG_MAX_BYTES:
+        log.warning("이미지 크기 초과 (%s bytes): %s", declared, url)
+        return None
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=_IMG_CHUNK_SIZE):
+        if not buf and not _looks_like_image(chunk[:12]):
+            log.warning("이미지 형식 아님 (head=%r): %s", chunk[:12], url)
+            return None
+        buf += chunk
+        if len(buf) > _IMG_MAX_BYTES:
+            log.warning("이미지 크기 초과 (>%d bytes): %s", _IMG_MAX_BYTES, url)
+            return None
+    return bytes(buf)
+
+
 def _fetch_image(url: str) -> bytes | None:
-    """이미지를 캐시하여 반복 요청 방지 (5분 TTL).
+    """이미지를 LRU 캐시하여 반복 요청 방지 (5분 TTL, 64개/128MB 상한).
+
+    st.cache_data와 달리 적중 시 pickle 왕복 없이 bytes를 그대로 반환한다.
+    """
+    global _img_cache_bytes
+    now = time.monotonic()
+    with _img_cache_lock:
+        hit = _img_cache.get(url)
+        if hit is not None and now - hit[0] < _IMG_CACHE_TTL:
+            _img_cache.move_to_end(url)
+            return hit[1]
+
+    data = _fetch_image_uncached(url)
+
+    with _img_cache_lock:
+        old = _img_cache.pop(url, None)
+        if old is not None:
+            _img_cache_bytes -= len(old[1] or b"")
+        _img_cache[url] = (now, data)
+        _img_cache_bytes += len(data or b"")
+        while _img_cache and (
+            len(_img_cache) > _IMG_CACHE_MAX_ENTRIES
+            or _img_cache_bytes > _IMG_CACHE_MAX_BYTES
+        ):
+            _, (_, evicted) = _img_cache.popitem(last=False)
+            _img_cache_bytes -= len(evicted or b"")
+    return data
+
+
+def _fetch_image_uncached(url: str) -> bytes | None:
+    """이미지를 원격에서 내려받는다.
 
     DCInside 이미지는 전용 세션(쿠키 + Referer + Sec-Fetch 헤더)을 사용하여
-    핫링크 차단 및 봇 차단을 우회한다.
+    핫링크 차단 및 봇 차단을 우회한다. 쿠키 만료로 401/403이 오면 세션을
+    재워밍업한 뒤 1회 재시도한다.
     """
     try:
         if _is_dc_url(url):
-            sess = _get_dc_session()
-            resp = sess.get(
-                url,
-                timeout=(5, 15),
-                headers={
-                    "Referer": "https://gall.dcinside.com/",
-                    "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-                    "Sec-Fetch-Dest": "image",
-                    "Sec-Fetch-Mode": "no-cors",
-                    "Sec-Fetch-Site": "cross-site",
-                },
-            )
+            for attempt in (0, 1):
+                resp = _get_dc_session().get(
+                    url,
+                    stream=True,
+                    timeout=(5, 15),
+                    headers={
+                        "Referer": "https://gall.dcinside.com/",
+                        "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+                        "Sec-Fetch-Dest": "image",
+                        "Sec-Fetch-Mode": "no-cors",
+                        "Sec-Fetch-Site": "cross-site",
+                    },
+                )
+                if resp.status_code in (401, 403) and attempt == 0:
+                    log.debug("DCInside %d — 세션 재워밍업 후 재시도: %s", resp.status_code, url)
+                    resp.close()
+                    _get_dc_session.clear()
+                    continue
+                break
         else:
-            resp = requests.get(
+            resp = _get_generic_session().get(
                 url,
+                stream=True,
                 timeout=(5, 10),
                 headers={
                     "Referer": _get_referer(url),
-                    "User-Agent": _UA,
                     "Accept": "image/*,*/*;q=0.8",
                 },
             )
-        resp.raise_for_status()
-        data = resp.content
-        # 200바이트 미만은 플레이스홀더 GIF일 가능성 높음 (1×1 GIF ≈ 43B)
-        if len(data) < 200:
+        with resp:
+            resp.raise_for_status()
+            data = _read_body(resp, url)
+        if not data:
+            return None
+        if data.startswith(b"GIF") and len(data) < _PLACEHOLDER_GIF_MAX:
             log.warning("이미지 크기 의심 (%d bytes, 플레이스홀더?): %s", len(data), url)
             return None
         return data
@@ -117,6 +224,36 @@ def _fetch_image(url: str) -> bytes | None:
         return None
 
 
+def _prefetch_neighbors(imgs: list[str], cur: int) -> None:
+    """현재 슬라이드의 앞/뒤 이미지를 백그라운드에서 미리 캐시에 적재한다.
+
+    캐시에 유효한 항목이 있으면 건너뛰고, 진행 중인 URL은
+    ``_prefetch_inflight``로 중복 제출을 막는다 (완료 시 제거되므로
+    TTL 만료·LRU 축출 후에는 다시 선로딩된다).
+    """
+    now = time.monotonic()
+    for i in (cur - 1, cur + 1):
+        if not 0 <= i < len(imgs):
+            continue
+        url = imgs[i]
+        with _img_cache_lock:
+            hit = _img_cache.get(url)
+            if hit is not None and now - hit[0] < _IMG_CACHE_TTL:
+                continue
+        with _prefetch_lock:
+            if url in _prefetch_inflight:
+                continue
+            _prefetch_inflight.add(url)
+        fut = _prefetch_pool.submit(_fetch_image, url)
+        fut.add_done_callback(lambda _f, _u=url: _prefetch_done(_u))
+
+
+def _prefetch_done(url: str) -> None:
+    """선로딩 완료(성공·실패 무관) 시 진행 중 목록에서 제거한다."""
+    with _prefetch_lock:
+        _prefetch_inflight.discard(url)
+
+
 @st.fragment
 def render_image_slider(images_raw: "str | list | None", key_prefix: str, width: int = 320) -> None:
     """이미지 URL 목록을 슬라이드로 렌더링한다.
@@ -129,12 +266,18 @@ def render_image_slider(images_raw: "str | list | None", key_prefix: str, width:
     """
     if not images_raw or images_raw == "[]":
         return
-    try:
-        imgs: list[str] = (
-            json.loads(images_raw) if isinstance(images_raw, str) else list(images_raw)
-        )
-    except Exception:
-        return
+    if isinstance(images_raw, str):
+        # ◀/▶ 클릭마다 fragment가 재실행되므로 원본 문자열 기준으로 파싱 결과 재사용
+        parsed: dict[str, list[str]] = st.session_state.setdefault("_img_parsed", {})
+        imgs = parsed.get(images_raw)
+        if imgs is None:
+            try:
+                imgs = list(_json_loads(images_raw))
+            except Exception:
+                return
+            parsed[images_raw] = imgs
+    else:
+        imgs = list(images_raw)
     if not imgs:
         return
 
@@ -142,6 +285,7 @@ def render_image_slider(images_raw: "str | list | None", key_prefix: str, width:
     if slide_key not in st.session_state:
         st.session_state[slide_key] = 0
     cur = max(0, min(st.session_state[slide_key], len(imgs) - 1))
+    _prefetch_neighbors(imgs, cur)
 
     if len(imgs) > 1:
         nav_l, nav_mid, nav_r = st.columns([1, 6, 1])
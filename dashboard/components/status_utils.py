@@ -1,14 +1,18 @@
 """대시보드 공통 유틸리티 — 상태, 시간, 통계 헬퍼."""
 
 import logging
+import threading
 import time as _time_util
-from datetime import timezone, timedelta
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 
 import requests as _http
 import streamlit as st
+from sqlalchemy import func
 
 from db.models import Post, PostStatus, Comment, Content
-from db.session import SessionLocal
+from db.session import ScopedSession
 
 log = logging.getLogger(__name__)
 
@@ -17,6 +21,13 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 KST = timezone(timedelta(hours=9))
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def _fmt_kst_minute(ts_minute: int) -> str:
+    """분 단위 epoch → KST 문자열 (같은 분의 타임스탬프는 캐시 적중)."""
+    return datetime.fromtimestamp(ts_minute * 60, tz=KST).strftime("%Y-%m-%d %H:%M")
 
 
 def to_kst(dt):
@@ -25,7 +36,7 @@ def to_kst(dt):
         return ""
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(KST).strftime("%Y-%m-%d %H:%M")
+    return _fmt_kst_minute(int(dt.timestamp()) // 60)
 
 
 # ---------------------------------------------------------------------------
@@ -53,28 +64,64 @@ def top_comments(post_id: int, session, limit: int = 2) -> list[Comment]:
     )
 
 
+def top_comments_bulk(
+    post_ids: list[int], session, limit: int = 2,
+) -> dict[int, list[Comment]]:
+    """여러 게시글의 베스트 댓글을 1회 쿼리로 조회 (ROW_NUMBER 윈도 함수).
+
+    Returns:
+        {post_id: [Comment, ...]} — 각 목록은 좋아요 내림차순, 최대 limit개
+    """
+    from sqlalchemy.orm import aliased
+
+    if not post_ids:
+        return {}
+    rn = func.row_number().over(
+        partition_by=Comment.post_id, order_by=Comment.likes.desc(),
+    ).label("rn")
+    sub = (
+        session.query(Comment, rn)
+        .filter(Comment.post_id.in_(post_ids))
+        .subquery()
+    )
+    ranked = aliased(Comment, sub)
+    rows = (
+        session.query(ranked)
+        .filter(sub.c.rn <= limit)
+        .order_by(sub.c.post_id, sub.c.rn)
+        .all()
+    )
+    result: dict[int, list[Comment]] = defaultdict(list)
+    for c in rows:
+        result[c.post_id].append(c)
+    return dict(result)
+
+
 # ---------------------------------------------------------------------------
 # 상태 변경 / 삭제
 # ---------------------------------------------------------------------------
 
-def update_status(post_id: int, new_status: PostStatus) -> None:
+def update_status(
+    post_id: int, new_status: PostStatus, updated_at: datetime | None = None,
+) -> None:
     """게시글 상태 업데이트 (직접 SQL UPDATE — 동시 수정 충돌·1020 에러 방지)."""
-    from datetime import datetime, timezone
     from sqlalchemy import update as _sql_update
 
+    updated_at = updated_at or datetime.now(_UTC)
+    session = ScopedSession()
     try:
-        with SessionLocal() as session:
-            result = session.execute(
-                _sql_update(Post)
-                .where(Post.id == post_id)
-                .values(status=new_status, updated_at=datetime.now(timezone.utc))
-            )
-            session.commit()
-            if result.rowcount > 0:
-                log.info("Post %d → %s", post_id, new_status.value)
-            else:
-                log.warning("Post %d 상태 업데이트: 0 rows (이미 변경됨?)", post_id)
+        result = session.execute(
+            _sql_update(Post)
+            .where(Post.id == post_id)
+            .values(status=new_status, updated_at=updated_at)
+        )
+        session.commit()
+        if result.rowcount > 0:
+            log.info("Post %d → %s", post_id, new_status.value)
+        else:
+            log.warning("Post %d 상태 업데이트: 0 rows (이미 변경됨?)", post_id)
     except Exception as exc:
+        session.rollback()
         log.exception("Post %d 상태 업데이트 실패: %s", post_id, exc)
         try:
             import streamlit as _st_fb
@@ -85,40 +132,45 @@ def update_status(post_id: int, new_status: PostStatus) -> None:
             }
         except Exception:
             pass
+    finally:
+        ScopedSession.remove()
 
 
-def batch_update_status(post_ids: list[int], new_status: PostStatus) -> int:
+def batch_update_status(
+    post_ids: list[int], new_status: PostStatus, updated_at: datetime | None = None,
+) -> int:
     """여러 게시글 상태를 단일 SQL UPDATE로 일괄 변경 (루프 N회 → 1회).
 
     성공/실패 결과를 session_state에 기록해 UI 피드백으로 표시.
     """
-    from datetime import datetime, timezone
     from sqlalchemy import update as _sql_update
 
     if not post_ids:
         return 0
+    updated_at = updated_at or datetime.now(_UTC)
+    session = ScopedSession()
     try:
-        with SessionLocal() as session:
-            result = session.execute(
-                _sql_update(Post)
-                .where(Post.id.in_(post_ids))
-                .values(status=new_status, updated_at=datetime.now(timezone.utc))
-            )
-            session.commit()
-            cnt = result.rowcount
-            log.info("Batch %d posts → %s (%d rows)", len(post_ids), new_status.value, cnt)
-            # 성공 피드백 저장
-            try:
-                import streamlit as _st_fb
-                _st_fb.session_state["_batch_result"] = {
-                    "status": "done",
-                    "count": cnt,
-                    "target": new_status.value,
-                }
-            except Exception:
-                pass
-            return cnt
+        result = session.execute(
+            _sql_update(Post)
+            .where(Post.id.in_(post_ids))
+            .values(status=new_status, updated_at=updated_at)
+        )
+        session.commit()
+        cnt = result.rowcount
+        log.info("Batch %d posts → %s (%d rows)", len(post_ids), new_status.value, cnt)
+        # 성공 피드백 저장
+        try:
+            import streamlit as _st_fb
+            _st_fb.session_state["_batch_result"] = {
+                "status": "done",
+                "count": cnt,
+                "target": new_status.value,
+            }
+        except Exception:
+            pass
+        return cnt
     except Exception as exc:
+        session.rollback()
         log.exception("Batch update failed: %s", exc)
         try:
             import streamlit as _st_fb
@@ -130,36 +182,91 @@ def batch_update_status(post_ids: list[int], new_status: PostStatus) -> int:
         except Exception:
             pass
         return 0
+    finally:
+        ScopedSession.remove()
+
+
+def batch_update_status_map(
+    mapping: dict[int, PostStatus], updated_at: datetime | None = None,
+) -> int:
+    """게시글별로 서로 다른 목표 상태를 단일 SQL UPDATE(CASE)로 일괄 변경.
+
+    update_status를 N회 호출(커밋 N회)하는 대신 1회 커밋으로 처리한다.
+    CASE 분기 값은 Post.status 컬럼 타입으로 바인딩해야 Enum → 문자열
+    변환이 적용된다 (타입 없는 바인드는 PostStatus 객체를 그대로 넘김).
+    """
+    from sqlalchemy import case, literal, type_coerce, update as _sql_update
+
+    if not mapping:
+        return 0
+    updated_at = updated_at or datetime.now(_UTC)
+    status_type = Post.status.type
+    status_case = type_coerce(
+        case(
+            {pid: literal(s, status_type) for pid, s in mapping.items()},
+            value=Post.id,
+        ),
+        status_type,
+    )
+    session = ScopedSession()
+    try:
+        result = session.execute(
+            _sql_update(Post)
+            .where(Post.id.in_(list(mapping)))
+            .values(status=status_case, updated_at=updated_at)
+        )
+        session.commit()
+        cnt = result.rowcount
+        log.info("Batch map %d posts (%d rows)", len(mapping), cnt)
+        return cnt
+    except Exception as exc:
+        session.rollback()
+        log.exception("Batch map update failed: %s", exc)
+        try:
+            import streamlit as _st_fb
+            _st_fb.session_state["_batch_result"] = {
+                "status": "error",
+                "error": str(exc),
+                "target": "mixed",
+            }
+        except Exception:
+            pass
+        return 0
+    finally:
+        ScopedSession.remove()
 
 
 def delete_post(post_id: int):
-    """게시글 삭제 (Content → Post 순서로 삭제해 FK 제약 위반 방지).
+    """게시글 삭제 (Comment/Content → Post 순서로 삭제해 FK 제약 위반 방지).
 
     삭제 전 (site_code, origin_id)를 crawl_blocklist에 등록하여 재수집을 방지한다.
+    ORM unit-of-work 대신 bulk DELETE 문을 직접 실행해 왕복 횟수를 줄인다.
     """
+    from sqlalchemy import delete as _sql_delete, insert as _sql_insert, select
     from db.models import CrawlBlocklist
 
-    with SessionLocal() as session:
-        post = session.get(Post, post_id)
-        if post:
-            # 블록리스트 등록 (재수집 방지)
-            exists = session.query(CrawlBlocklist).filter_by(
-                site_code=post.site_code, origin_id=post.origin_id
-            ).first()
-            if not exists:
-                session.add(CrawlBlocklist(
-                    site_code=post.site_code, origin_id=post.origin_id
-                ))
-                session.flush()
-
-            # Content → Post 순서로 삭제
-            content = session.query(Content).filter_by(post_id=post_id).first()
-            if content:
-                session.delete(content)
-                session.flush()
-            session.delete(post)
+    session = ScopedSession()
+    try:
+        key = session.execute(
+            select(Post.site_code, Post.origin_id).where(Post.id == post_id)
+        ).first()
+        if key:
+            # 블록리스트 등록 (재수집 방지) — UNIQUE 충돌은 INSERT IGNORE로 흡수
+            session.execute(
+                _sql_insert(CrawlBlocklist)
+                .prefix_with("IGNORE")
+                .values(site_code=key.site_code, origin_id=key.origin_id)
+            )
+            session.execute(_sql_delete(Comment).where(Comment.post_id == post_id))
+            session.execute(_sql_delete(Content).where(Content.post_id == post_id))
+            session.execute(_sql_delete(Post).where(Post.id == post_id))
         session.commit()
         log.info("Post %d deleted", post_id)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        ScopedSession.remove()
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +310,16 @@ STATUS_TEXT = {
     PostStatus.FAILED: "실패",
 }
 
+# (color, emoji, text) 융합 테이블 — 행마다 dict 3회 조회 대신 1회
+_STATUS_META: dict[PostStatus, tuple[str, str, str]] = {
+    s: (STATUS_COLORS[s], STATUS_EMOJI[s], STATUS_TEXT[s]) for s in PostStatus
+}
+
+
+def status_meta(status: PostStatus) -> tuple[str, str, str]:
+    """상태별 (color, emoji, text) 튜플 반환."""
+    return _STATUS_META[status]
+
 
 # ---------------------------------------------------------------------------
 # Ollama 헬스체크
@@ -210,21 +327,58 @@ STATUS_TEXT = {
 
 _ollama_health_cache: dict = {"status": None, "checked_at": 0.0}
 _OLLAMA_HEALTH_TTL = 30  # 30초 캐싱
+_ollama_refresh_lock = threading.Lock()
+# keep-alive 세션 재사용 — 프로브마다 TCP 핸드셰이크 반복 방지
+_ollama_sess = _http.Session()
 
 
-def check_ollama_health() -> bool:
-    """Ollama 서버 응답 여부를 확인 (30초 캐싱으로 반복 요청 방지)."""
+def _probe_ollama() -> bool:
+    """Ollama 서버에 실제 요청을 보내 결과를 캐시에 기록한다."""
     from config.settings import get_ollama_host
     _now = _time_util.time()
-    if (
-        _ollama_health_cache["status"] is not None
-        and _now - _ollama_health_cache["checked_at"] < _OLLAMA_HEALTH_TTL
-    ):
-        return _ollama_health_cache["status"]
     try:
-        _http.get(f"{get_ollama_host()}/api/tags", timeout=2)
-        _ollama_health_cache.update({"status": True, "checked_at": _now})
-        return True
+        # /api/version: 모델 목록(/api/tags) 대신 수십 바이트 응답
+        _ollama_sess.get(f"{get_ollama_host()}/api/version", timeout=2)
+        ok = True
     except Exception:
-        _ollama_health_cache.update({"status": False, "checked_at": _now})
-        return False
+        ok = False
+    _ollama_health_cache.update({"status": ok, "checked_at": _now})
+    return ok
+
+
+def _refresh_ollama() -> None:
+    """백그라운드 갱신 스레드 본체 — 동시에 1개만 실행."""
+    try:
+        _probe_ollama()
+    finally:
+        _ollama_refresh_lock.release()
+
+
+def check_ollama_health() -> bool:
+    """Ollama 서버 응답 여부를 확인 (30초 캐싱, stale-while-revalidate).
+
+    캐시가 TTL의 절반을 넘기면 백그라운드 스레드로 갱신하고 기존 값을 즉시 반환한다.
+    캐시가 비어 있을 때(최초 호출)만 동기적으로 대기한다.
+    """
+    status = _ollama_health_cache["status"]
+    if status is None:
+        return _probe_ollama()
+    age = _time_util.time() - _ollama_health_cache["checked_at"]
+    if age > _OLLAMA_HEALTH_TTL / 2 and _ollama_refresh_lock.acquire(blocking=False):
+        threading.Thread(target=_refresh_ollama, daemon=True, name="ollama-health").start()
+    return status
+
+
+def peek_ollama_health() -> bool | None:
+    """캐시된 Ollama 상태만 반환한다 (프로브 없음, 미확인이면 None)."""
+    return _ollama_health_cache["status"]
+
+
+def warm_ollama_health() -> None:
+    """캐시가 비어 있으면 백그라운드로 첫 프로브를 시작한다 (논블로킹).
+
+    탭 렌더링 시 호출해두면 버튼 클릭 경로의 check_ollama_health()가
+    최초 동기 프로브를 기다리지 않는다.
+    """
+    if _ollama_health_cache["status"] is None and _ollama_refresh_lock.acquire(blocking=False):
+        threading.Thread(target=_refresh_ollama, daemon=True, name="ollama-health").start()
@@ -1,6 +1,7 @@
 """스타일 프리셋 관리."""
 
 import json
+import time as _time_util
 
 from config.settings import load_pipeline_config, save_pipeline_config
 
@@ -13,9 +14,38 @@ _DEFAULT_STYLE_PRESETS: list[dict] = [
 ]
 
 
+# 파싱 결과 인메모리 캐시 (5분 TTL, 저장 시 즉시 갱신)
+_presets_cache: dict = {"data": None, "map": None, "ts": 0.0}
+_PRESETS_TTL = 300
+
+
 def load_style_presets() -> list[dict]:
-    """pipeline.json에서 스타일 프리셋 로드. 없으면 기본값 반환."""
-    raw = load_pipeline_config().get("style_presets")
+    """pipeline.json에서 스타일 프리셋 로드 (5분 캐싱). 없으면 기본값 반환."""
+    _now = _time_util.time()
+    if (
+        _presets_cache["data"] is not None
+        and _now - _presets_cache["ts"] < _PRESETS_TTL
+    ):
+        return list(_presets_cache["data"])
+    presets = _parse_style_presets(load_pipeline_config().get("style_presets"))
+    _presets_cache.update({"data": presets, "map": None, "ts": _now})
+    return list(presets)
+
+
+def load_style_preset_map() -> dict[str, str]:
+    """프리셋 이름 → 프롬프트 매핑 (load_style_presets 캐시와 함께 갱신).
+
+    편집실 rerun마다 dict를 재구성하지 않도록 캐시된 매핑 자체를 반환한다.
+    호출 측에서 수정하지 말 것.
+    """
+    presets = load_style_presets()
+    if _presets_cache["map"] is None:
+        _presets_cache["map"] = {p["name"]: p["prompt"] for p in presets}
+    return _presets_cache["map"]
+
+
+def _parse_style_presets(raw) -> list[dict]:
+    """설정값(list 또는 레거시 문자열 JSON)을 프리셋 목록으로 변환."""
     if raw:
         try:
             data = json.loads(raw) if isinstance(raw, str) else raw
@@ -29,5 +59,7 @@ def load_style_presets() -> list[dict]:
 def save_style_presets(presets: list[dict]) -> None:
     """스타일 프리셋을 pipeline.json에 저장."""
     cfg = load_pipeline_config()
-    cfg["style_presets"] = json.dumps(presets, ensure_ascii=False)
+    # 리스트 그대로 저장 — 외부 json.dump에서 1회만 직렬화 (문자열 저장은 레거시)
+    cfg["style_presets"] = list(presets)
     save_pipeline_config(cfg)
+    _presets_cache.update({"data": list(presets), "map": None, "ts": _time_util.time()})
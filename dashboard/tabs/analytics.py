@@ -1,19 +1,32 @@
 """분석 (Analytics) 탭."""
 
+import heapq
 import logging
 import threading as _threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Any as _Any
 
+import numpy as np
 import streamlit as st
-from sqlalchemy import func
-
-from ai_worker.script.client import call_ollama_raw
+from sqlalchemy import Integer, Numeric, case, cast, func
+from sqlalchemy.orm import contains_eager, raiseload
+
+from ai_worker.script.client import call_ollama_stream
+from analytics.ab_test import (
+    list_tests, create_test, cancel_test,
+    evaluate_group, apply_winner, VARIANT_PRESETS,
+)
+from analytics.feedback import (
+    load_feedback_config, generate_structured_insights,
+    apply_feedback, build_performance_summary,
+)
 from config.settings import load_pipeline_config, OLLAMA_MODEL
 from db.models import Post, PostStatus, Content
-from db.session import SessionLocal
+from db.session import SessionLocal, engine
 
-from dashboard.components.status_utils import check_ollama_health
+from dashboard.components.status_utils import check_ollama_health, warm_ollama_health
 
 log = logging.getLogger(__name__)
 
@@ -27,35 +40,31 @@ _insight_lock = _threading.Lock()
 _feedback_task: dict[str, _Any] = {}
 _feedback_lock = _threading.Lock()
 
+# 인사이트/피드백 LLM 작업 전용 풀 — 클릭마다 스레드 생성 대신 동시 실행 수 제한
+_llm_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="analytics-llm")
 
-def _submit_insight_task(
+
+@lru_cache(maxsize=16)
+def _build_insight_prompt(
     period_days: int,
     total_collected: int,
     total_approved: int,
     total_uploaded: int,
     conversion_rate: float,
-    ranked: list[dict],
-    llm_model: str,
-) -> bool:
-    """AI 인사이트 생성을 백그라운드 스레드에 제출."""
-    with _insight_lock:
-        existing = _insight_tasks.get(period_days)
-        if existing and existing["status"] == "running":
-            return False
-        _insight_tasks[period_days] = {"status": "running"}
-
-    def _run() -> None:
-        try:
-            _data_summary = "\n".join(
-                f"- {r['title'][:60]}: 조회수 {r['views']:,}, 좋아요 {r['likes']:,}"
-                + (
-                    f", 시청유지율 {r['analytics']['avg_watch_pct']:.1f}%"
-                    if r["analytics"].get("avg_watch_pct")
-                    else ""
-                )
-                for r in ranked[:10]
-            )
-            _prompt = f"""당신은 유튜브 쇼츠 채널 성과 분석 전문가입니다.
+    rows: tuple[tuple[str, int, int, float], ...],
+) -> str:
+    """인사이트 프롬프트 생성 — 동일 입력 재클릭/재생성 시 캐시 재사용.
+
+    rows: (제목[:60], 조회수, 좋아요, 시청유지율) 튜플 — 해시 가능한 형태로 전달.
+    """
+    _lines = []
+    for title, views, likes, watch_pct in rows:
+        _line = f"- {title}: 조회수 {views:,}, 좋아요 {likes:,}"
+        if watch_pct:
+            _line += f", 시청유지율 {watch_pct:.1f}%"
+        _lines.append(_line)
+    _data_summary = "\n".join(_lines)
+    return f"""당신은 유튜브 쇼츠 채널 성과 분석 전문가입니다.
 아래 최근 {period_days}일 업로드 영상 성과 데이터를 분석하고,
 운영자에게 유용한 인사이트 3~5가지를 간결하게 한국어로 작성하세요.
 
@@ -70,19 +79,70 @@ def _submit_insight_task(
 - 다음 {period_days}일 운영 전략 제안
 각 항목은 "- " 로 시작하는 한 줄 문장으로 작성하세요."""
 
-            _insight_text = call_ollama_raw(
+
+def _submit_insight_task(
+    period_days: int,
+    total_collected: int,
+    total_approved: int,
+    total_uploaded: int,
+    conversion_rate: float,
+    ranked: list[dict],
+    llm_model: str,
+) -> bool:
+    """AI 인사이트 생성을 공유 LLM 풀에 제출."""
+    with _insight_lock:
+        existing = _insight_tasks.get(period_days)
+        if existing and existing["status"] == "running":
+            return False
+
+        _rows = tuple(
+            (
+                r["title"][:60],
+                r["views"],
+                r["likes"],
+                r["analytics"].get("avg_watch_pct") or 0.0,
+            )
+            for r in ranked[:10]
+        )
+        _prompt = _build_insight_prompt(
+            period_days, total_collected, total_approved, total_uploaded,
+            conversion_rate, _rows,
+        )
+
+        _done_evt = _threading.Event()
+        _task: dict[str, _Any] = {"status": "running", "partial": "", "event": _done_evt}
+        _insight_tasks[period_days] = _task
+
+        def _run() -> str:
+            # 스트리밍 조각을 누적해 partial에 게시 → poller가 생성 중 텍스트를 표시
+            _buf: list[str] = []
+            for _piece in call_ollama_stream(
                 prompt=_prompt,
                 model=llm_model,
                 max_tokens=512,
                 temperature=0.7,
-            ).strip()
-            with _insight_lock:
-                _insight_tasks[period_days] = {"status": "done", "result": _insight_text}
-        except Exception as _ex:
-            with _insight_lock:
-                _insight_tasks[period_days] = {"status": "error", "error": str(_ex)}
-
-    _threading.Thread(target=_run, daemon=True).start()
+            ):
+                _buf.append(_piece)
+                _task["partial"] = "".join(_buf)
+            return "".join(_buf).strip()
+
+        _future = _llm_executor.submit(_run)
+        _task["future"] = _future
+
+    def _on_done(fut: Future) -> None:
+        exc = fut.exception()
+        with _insight_lock:
+            if exc is None:
+                _insight_tasks[period_days] = {
+                    "status": "done", "result": fut.result(), "event": _done_evt,
+                }
+            else:
+                _insight_tasks[period_days] = {
+                    "status": "error", "error": str(exc), "event": _done_evt,
+                }
+        _done_evt.set()
+
+    _future.add_done_callback(_on_done)
     return True
 
 
@@ -93,95 +153,303 @@ def _submit_feedback_task(period_days: int, llm_model: str | None) -> bool:
             return False
         _feedback_task.clear()
         _feedback_task["status"] = "running"
+        _feedback_task["event"] = _threading.Event()
 
     def _run() -> None:
-        try:
-            from analytics.feedback import (
-                load_feedback_config, generate_structured_insights,
-                apply_feedback, build_performance_summary,
-            )
-            with SessionLocal() as _fb_s:
-                _perf = build_performance_summary(_fb_s, days_back=period_days)
-            if not _perf:
-                with _feedback_lock:
-                    _feedback_task.update({"status": "error", "error": "분석할 데이터 없음"})
-                return
-            _insights = generate_structured_insights(_perf, llm_model=llm_model)
-            apply_feedback(_insights)
-            with _feedback_lock:
+        with SessionLocal() as _fb_s:
+            _perf = build_performance_summary(_fb_s, days_back=period_days)
+        if not _perf:
+            raise RuntimeError("분석할 데이터 없음")
+        _insights = generate_structured_insights(_perf, llm_model=llm_model)
+        apply_feedback(_insights)
+
+    def _on_done(fut: Future) -> None:
+        exc = fut.exception()
+        with _feedback_lock:
+            if exc is None:
                 _feedback_task.update({"status": "done"})
-        except Exception as _ex:
-            with _feedback_lock:
-                _feedback_task.update({"status": "error", "error": str(_ex)})
+            else:
+                _feedback_task.update({"status": "error", "error": str(exc)})
+            _feedback_task["event"].set()
 
-    _threading.Thread(target=_run, daemon=True).start()
+    _llm_executor.submit(_run).add_done_callback(_on_done)
     return True
 
 
-def render() -> None:
-    """분석 탭 렌더링."""
+# 퍼널 단계별 누적 상태 (승인 이후 / 렌더링 이후)
+_APPROVED_LIKE = (
+    PostStatus.APPROVED, PostStatus.PROCESSING,
+    PostStatus.PREVIEW_RENDERED, PostStatus.RENDERED, PostStatus.UPLOADED,
+)
+_RENDERED_LIKE = (PostStatus.PREVIEW_RENDERED, PostStatus.RENDERED, PostStatus.UPLOADED)
 
-    st.header("📊 분석")
 
-    # ---------------------------------------------------------------------------
-    # 기간 선택
-    # ---------------------------------------------------------------------------
-    hdr_c1, hdr_c2 = st.columns([4, 1])
-    with hdr_c1:
-        period_days = st.selectbox(
-            "분석 기간",
-            [7, 14, 30],
-            format_func=lambda d: f"최근 {d}일",
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_analytics_counts(period_days: int) -> tuple[int, int, int, int]:
+    """기간 내 (수집, 승인, 렌더링, 업로드) 건수 — 1회 스캔 + 조건부 합계."""
+    since_dt = datetime.now(timezone.utc) - timedelta(days=period_days)
+    with SessionLocal() as _db:
+        _counts = (
+            _db.query(
+                func.count(Post.id),
+                func.sum(case((Post.status.in_(_APPROVED_LIKE), 1), else_=0)),
+                func.sum(case((Post.status.in_(_RENDERED_LIKE), 1), else_=0)),
+                func.sum(case((Post.status == PostStatus.UPLOADED, 1), else_=0)),
+            )
+            .filter(Post.created_at >= since_dt)
+            .one()
         )
-    with hdr_c2:
-        if st.button("🔄 새로고침", key="analytics_refresh", width="stretch"):
-            st.rerun()
+    return (
+        _counts[0] or 0,
+        int(_counts[1] or 0),
+        int(_counts[2] or 0),
+        int(_counts[3] or 0),
+    )
 
-    since_dt = datetime.now(timezone.utc) - timedelta(days=period_days)
 
-    # ---------------------------------------------------------------------------
-    # DB 집계
-    # ---------------------------------------------------------------------------
+# 업로드 목록 조회 상한 (기간 필터에 더한 안전장치)
+_UPLOADED_FETCH_LIMIT = 500
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_uploaded_contents(period_days: int, token: str = "") -> list[dict]:
+    """기간 내 업로드된 컨텐츠 목록 (analytics 데이터 포함, 최근순 최대 500건).
+
+    token(_ranked_token)이 바뀌면 TTL과 무관하게 캐시 키가 달라져 재조회된다.
+
+    캐시 해싱 비용과 DetachedInstanceError를 피하기 위해 ORM 객체 대신
+    plain dict로 변환해 반환한다.
+    """
+    since_dt = datetime.now(timezone.utc) - timedelta(days=period_days)
     with SessionLocal() as _db:
-        _total_collected = (
-            _db.query(func.count(Post.id))
-            .filter(Post.created_at >= since_dt)
-            .scalar() or 0
+        # Content.post는 JOIN 결과로 채우고, 그 외 관계는 지연 로딩 금지 (N+1 방지)
+        rows = (
+            _db.query(Content)
+            .join(Content.post)
+            .options(contains_eager(Content.post), raiseload("*"))
+            .filter(Post.status == PostStatus.UPLOADED, Post.updated_at >= since_dt)
+            .order_by(Post.updated_at.desc())
+            .limit(_UPLOADED_FETCH_LIMIT)
+            .all()
         )
-        _total_approved = (
-            _db.query(func.count(Post.id))
-            .filter(
-                Post.created_at >= since_dt,
-                Post.status.in_([
-                    PostStatus.APPROVED, PostStatus.PROCESSING,
-                    PostStatus.PREVIEW_RENDERED, PostStatus.RENDERED,
-                    PostStatus.UPLOADED,
-                ]),
-            )
-            .scalar() or 0
+        return [
+            {
+                "post_id": _cnt.post.id,
+                "title": _cnt.post.title,
+                "stats": _cnt.post.stats or {},
+                "upload_meta": _cnt.upload_meta or {},
+                "updated_at": _cnt.post.updated_at,
+            }
+            for _cnt in rows
+        ]
+
+
+# 전환 퍼널 막대 1행 템플릿 (4단계를 이어 붙여 단일 st.markdown으로 렌더링)
+_FUNNEL_ROW_TEMPLATE = """<div style="margin:4px 0">
+<span style="display:inline-block;width:60px;font-size:0.8rem">{label}</span>
+<span style="display:inline-block;height:18px;width:{width}px;
+background:{color};border-radius:3px;vertical-align:middle"></span>
+<span style="margin-left:8px;font-size:0.85rem">{count:,}건 ({pct:.1f}%)</span>
+</div>"""
+
+# Top 영상 조회 개수 — 화면 Top 5 + LLM 인사이트 입력 Top 10
+_TOP_LIMIT = 10
+
+
+def _to_ranked_item(row: dict) -> dict:
+    """업로드 컨텐츠 dict → 랭킹 항목 (YouTube analytics 우선, 없으면 post.stats)."""
+    _yt = row["upload_meta"].get("youtube", {})
+    _analytics = _yt.get("analytics", {})
+    _views = _analytics.get("views") or row["stats"].get("views", 0)
+    _likes = _analytics.get("likes") or row["stats"].get("likes", 0)
+    return {
+        "title": row["title"],
+        "views": int(_views),
+        "likes": int(_likes),
+        "url": _yt.get("url", ""),
+        "post_id": row["post_id"],
+        "analytics": _analytics,
+    }
+
+
+def _summarize_uploads(rows: list[dict], top_n: int) -> tuple[list[dict], dict | None]:
+    """업로드 목록을 1회 순회하며 상위 N개와 성과 지표를 함께 계산한다.
+
+    순회 중 컬럼별 배열(SoA)을 채우고 크기 top_n 힙으로 상위 항목을 유지한 뒤,
+    평균/합계는 NumPy 리덕션으로 구한다. 동률이면 목록 앞쪽(최근 업로드)이 우선.
+
+    Returns:
+        (조회수 내림차순 상위 항목 목록, 성과 지표 dict 또는 None(데이터 없음))
+    """
+    n = len(rows)
+    views = np.empty(n, dtype=np.int64)
+    likes = np.empty(n, dtype=np.int64)
+    watch = np.full(n, np.nan, dtype=np.float64)
+    subs = np.zeros(n, dtype=np.int64)
+    heap: list[tuple[int, int, dict]] = []
+    for i, row in enumerate(rows):
+        item = _to_ranked_item(row)
+        views[i] = item["views"]
+        likes[i] = item["likes"]
+        _an = item["analytics"]
+        if "avg_watch_pct" in _an:
+            watch[i] = _an["avg_watch_pct"]
+        subs[i] = _an.get("subscriber_gained", 0)
+        entry = (item["views"], -i, item)
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heappushpop(heap, entry)
+
+    top = [e[2] for e in sorted(heap, key=lambda e: e[:2], reverse=True)]
+    if not n:
+        return top, None
+    watch_valid = watch[~np.isnan(watch)]
+    return top, {
+        "avg_views": float(views.mean()),
+        "avg_likes": float(likes.mean()),
+        "avg_watch": float(watch_valid.mean()) if watch_valid.size else None,
+        "sub_conv": int(subs.sum()),
+    }
+
+
+# json_extract 기반 SQL 랭킹·집계 지원 여부 (미지원 DB는 _summarize_uploads로 Python 계산)
+_SQL_RANKING = engine.dialect.name in ("mysql", "mariadb")
+
+
+def _yt_metric(key: str, stats_key: str | None = None):
+    """YouTube analytics 지표 SQL 식 — 0/누락이면 post.stats 값, 그것도 없으면 0."""
+    _analytics = func.nullif(cast(
+        func.json_extract(Content.upload_meta, f"$.youtube.analytics.{key}"), Integer,
+    ), 0)
+    if stats_key is None:
+        return func.coalesce(_analytics, 0)
+    return func.coalesce(
+        _analytics, cast(func.json_extract(Post.stats, f"$.{stats_key}"), Integer), 0,
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_top_uploads(
+    period_days: int, token: str = "", limit: int = _TOP_LIMIT,
+) -> list[dict]:
+    """조회수 상위 업로드 영상 — SQL ORDER BY + LIMIT으로 상위 N행만 조회 (MySQL 계열)."""
+    since_dt = datetime.now(timezone.utc) - timedelta(days=period_days)
+    with SessionLocal() as _db:
+        rows = (
+            _db.query(Post.id, Post.title, Post.stats, Post.updated_at, Content.upload_meta)
+            .join(Content, Content.post_id == Post.id)
+            .filter(Post.status == PostStatus.UPLOADED, Post.updated_at >= since_dt)
+            .order_by(_yt_metric("views", "views").desc(), Post.updated_at.desc())
+            .limit(limit)
+            .all()
         )
-        _total_rendered = (
-            _db.query(func.count(Post.id))
-            .filter(
-                Post.created_at >= since_dt,
-                Post.status.in_([PostStatus.PREVIEW_RENDERED, PostStatus.RENDERED, PostStatus.UPLOADED]),
+    return [
+        _to_ranked_item({
+            "post_id": r.id,
+            "title": r.title,
+            "stats": r.stats or {},
+            "upload_meta": r.upload_meta or {},
+            "updated_at": r.updated_at,
+        })
+        for r in rows
+    ]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_perf_aggregates(period_days: int, token: str = "") -> dict | None:
+    """성과 지표(평균 조회수·좋아요·시청 유지율, 구독 전환 합계) — DB 집계 1회 (MySQL 계열).
+
+    행별 JSON을 Python으로 가져오지 않고 서버에서 AVG/SUM으로 계산한다.
+    시청 유지율은 값이 있는 행만 평균한다 (AVG는 NULL 무시).
+    """
+    _watch = cast(
+        func.json_extract(Content.upload_meta, "$.youtube.analytics.avg_watch_pct"),
+        Numeric(10, 4),
+    )
+    since_dt = datetime.now(timezone.utc) - timedelta(days=period_days)
+    with SessionLocal() as _db:
+        n, avg_views, avg_likes, avg_watch, sub_conv = (
+            _db.query(
+                func.count(Post.id),
+                func.avg(_yt_metric("views", "views")),
+                func.avg(_yt_metric("likes", "likes")),
+                func.avg(_watch),
+                func.sum(_yt_metric("subscriber_gained")),
             )
-            .scalar() or 0
-        )
-        _total_uploaded = (
-            _db.query(func.count(Post.id))
-            .filter(Post.created_at >= since_dt, Post.status == PostStatus.UPLOADED)
-            .scalar() or 0
-        )
-        # 업로드된 컨텐츠 목록 (analytics 데이터 포함)
-        _uploaded_contents: list[tuple[Post, Content]] = (
-            _db.query(Post, Content)
             .join(Content, Content.post_id == Post.id)
+            .filter(Post.status == PostStatus.UPLOADED, Post.updated_at >= since_dt)
+            .one()
+        )
+    if not n:
+        return None
+    return {
+        "avg_views": float(avg_views or 0),
+        "avg_likes": float(avg_likes or 0),
+        "avg_watch": float(avg_watch) if avg_watch is not None else None,
+        "sub_conv": int(sub_conv or 0),
+    }
+
+
+def _ranked_token() -> str:
+    """업로드 목록 신선도 토큰 — UPLOADED 게시글의 최신 updated_at."""
+    with SessionLocal() as _db:
+        latest = (
+            _db.query(func.max(Post.updated_at))
             .filter(Post.status == PostStatus.UPLOADED)
-            .order_by(Post.updated_at.desc())
-            .all()
+            .scalar()
+        )
+    return latest.isoformat() if latest else ""
+
+
+def _get_ranked_summary(period_days: int) -> tuple[list[dict], dict | None]:
+    """(상위 업로드 영상, 성과 지표) — 신선도 토큰이 같으면 session_state 값 재사용.
+
+    rerun마다 랭킹 목록을 재구성·해싱하지 않도록 토큰 비교만으로 캐시 적중을 판정한다.
+    """
+    token = _ranked_token()
+    _key = f"_ranked_{period_days}"
+    cached = st.session_state.get(_key)
+    if cached and cached[0] == token:
+        return cached[1], cached[2]
+    if _SQL_RANKING:
+        top = _fetch_top_uploads(period_days, token)
+        perf = _fetch_perf_aggregates(period_days, token)
+    else:
+        top, perf = _summarize_uploads(
+            _fetch_uploaded_contents(period_days, token), _TOP_LIMIT,
         )
+    st.session_state[_key] = (token, top, perf)
+    return top, perf
 
+
+def _load_insight_inputs(period_days: int) -> tuple[int, int, int, float, list[dict]]:
+    """인사이트 프롬프트 입력 (수집, 승인, 업로드, 전환율, 상위 영상) — 캐시 재사용."""
+    collected, approved, _rendered, uploaded = _fetch_analytics_counts(period_days)
+    rate = (uploaded / collected * 100) if collected else 0.0
+    return collected, approved, uploaded, rate, _get_ranked_summary(period_days)[0]
+
+
+def _clear_analytics_cache() -> None:
+    """DB 집계 캐시 무효화 (Analytics 수집 후 호출)."""
+    _fetch_analytics_counts.clear()
+    _fetch_uploaded_contents.clear()
+    _fetch_top_uploads.clear()
+    _fetch_perf_aggregates.clear()
+    # upload_meta만 바뀌면 토큰(updated_at)이 그대로이므로 저장된 랭킹도 폐기
+    for _k in [k for k in st.session_state if str(k).startswith("_ranked_")]:
+        del st.session_state[_k]
+
+
+@st.fragment
+def _render_metrics(period_days: int) -> None:
+    """파이프라인 생산성 · Top 5 · 성과 분석 섹션 (fragment)."""
+    # ---------------------------------------------------------------------------
+    # DB 집계 (60초 캐싱 — rerun마다 재조회 방지)
+    # ---------------------------------------------------------------------------
+    _total_collected, _total_approved, _total_rendered, _total_uploaded = (
+        _fetch_analytics_counts(period_days)
+    )
     _conversion_rate = (_total_uploaded / _total_collected * 100) if _total_collected else 0.0
 
     # ---------------------------------------------------------------------------
@@ -205,47 +473,29 @@ def render() -> None:
                 ("렌더링", _total_rendered, "#ed8936"),
                 ("업로드", _total_uploaded, "#e53e3e"),
             ]
-            for label, count, color in stages:
-                pct = count / _total_collected if _total_collected else 0
-                st.markdown(
-                    f"""<div style="margin:4px 0">
-<span style="display:inline-block;width:60px;font-size:0.8rem">{label}</span>
-<span style="display:inline-block;height:18px;width:{int(pct*400)}px;
-background:{color};border-radius:3px;vertical-align:middle"></span>
-<span style="margin-left:8px;font-size:0.85rem">{count:,}건 ({pct*100:.1f}%)</span>
-</div>""",
-                    unsafe_allow_html=True,
+            _funnel_html = "".join(
+                _FUNNEL_ROW_TEMPLATE.format(
+                    label=label,
+                    width=int(count / _total_collected * 400),
+                    color=color,
+                    count=count,
+                    pct=count / _total_collected * 100,
                 )
+                for label, count, color in stages
+            )
+            # 단계별 st.markdown 4회 → 1회 (브라우저로 가는 엘리먼트 수 감소)
+            st.markdown(_funnel_html, unsafe_allow_html=True)
 
     # ---------------------------------------------------------------------------
     # 🏆 Top 5 영상
     # ---------------------------------------------------------------------------
     st.subheader("🏆 Top 5 영상 (조회수 기준)")
 
-    # upload_meta 또는 post.stats 에서 조회수 수집
-    _ranked: list[dict] = []
-    for _post, _cnt in _uploaded_contents:
-        _meta = _cnt.upload_meta or {}
-        # YouTube Analytics에서 수집된 최신 analytics 우선, 없으면 post.stats
-        _yt = _meta.get("youtube", {})
-        _analytics = _yt.get("analytics", {})
-        _views = _analytics.get("views") or (_post.stats or {}).get("views", 0)
-        _likes = _analytics.get("likes") or (_post.stats or {}).get("likes", 0)
-        _yt_url = _yt.get("url", "")
-        _ranked.append({
-            "title": _post.title,
-            "views": int(_views),
-            "likes": int(_likes),
-            "url": _yt_url,
-            "post_id": _post.id,
-            "analytics": _analytics,
-        })
-
-    _ranked.sort(key=lambda x: x["views"], reverse=True)
+    _top_ranked, _perf = _get_ranked_summary(period_days)
 
-    if _ranked:
+    if _top_ranked:
         with st.container(border=True):
-            for rank, item in enumerate(_ranked[:5], 1):
+            for rank, item in enumerate(_top_ranked[:5], 1):
                 rc1, rc2, rc3 = st.columns([6, 2, 2])
                 with rc1:
                     _title_str = item["title"][:55] + "..." if len(item["title"]) > 55 else item["title"]
@@ -270,21 +520,11 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
     # ---------------------------------------------------------------------------
     st.subheader("📉 성과 분석")
     with st.container(border=True):
-        if _ranked:
-            _all_views = [r["views"] for r in _ranked]
-            _all_likes = [r["likes"] for r in _ranked]
-            _analytics_items = [r["analytics"] for r in _ranked if r["analytics"]]
-
-            avg_views = sum(_all_views) / len(_all_views) if _all_views else 0
-            avg_likes = sum(_all_likes) / len(_all_likes) if _all_likes else 0
-            avg_watch = (
-                sum(a["avg_watch_pct"] for a in _analytics_items if "avg_watch_pct" in a)
-                / len([a for a in _analytics_items if "avg_watch_pct" in a])
-                if any("avg_watch_pct" in a for a in _analytics_items) else None
-            )
-            sub_conv = (
-                sum(a.get("subscriber_gained", 0) for a in _analytics_items)
-            )
+        if _perf:
+            avg_views = _perf["avg_views"]
+            avg_likes = _perf["avg_likes"]
+            avg_watch = _perf["avg_watch"]
+            sub_conv = _perf["sub_conv"]
 
             pa1, pa2, pa3, pa4 = st.columns(4)
             pa1.metric("평균 조회수", f"{avg_views:,.0f}회")
@@ -303,38 +543,85 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
         st.caption("업로드된 영상의 조회수·좋아요·시청 유지율을 YouTube Analytics API에서 가져옵니다.")
         if st.button("📡 Analytics 수집", key="fetch_analytics", width="content"):
             _fetched, _errors = 0, 0
-            with st.spinner("YouTube Analytics 수집 중..."):
-                for _post, _cnt in _uploaded_contents:
-                    _meta = dict(_cnt.upload_meta or {})
-                    _yt = _meta.get("youtube", {})
-                    _video_id = _yt.get("video_id")
-                    if not _video_id:
-                        continue
+            _uploaded_contents = _fetch_uploaded_contents(period_days, _ranked_token())
+            with st.spinner("YouTube Analytics 수집 중..."), SessionLocal() as _s:
+                # post_id → Content.id 매핑만 IN 쿼리 1회로 조회 (ORM 객체 로딩 불필요)
+                _content_ids = dict(
+                    _s.query(Content.post_id, Content.id).filter(
+                        Content.post_id.in_([_r["post_id"] for _r in _uploaded_contents])
+                    )
+                )
+                _targets = [
+                    (_row, _row["upload_meta"].get("youtube", {}).get("video_id"))
+                    for _row in _uploaded_contents
+                ]
+                _targets = [(_row, _vid) for _row, _vid in _targets if _vid]
+                _bulk: dict[str, dict] = {}
+                if _targets:
                     try:
                         from uploaders.youtube import YouTubeUploader
-                        _uploader = YouTubeUploader()
-                        _stats = _uploader.fetch_analytics(_video_id)
-                        if _stats:
-                            _yt["analytics"] = {
-                                **_stats,
-                                "collected_at": datetime.now(timezone.utc).isoformat(),
-                            }
-                            _meta["youtube"] = _yt
-                            with SessionLocal() as _s:
-                                _c = _s.query(Content).filter_by(post_id=_post.id).first()
-                                if _c:
-                                    _c.upload_meta = _meta
-                                    _s.commit()
-                            _fetched += 1
+                        # 영상별 요청 대신 videos.list 일괄 조회 (50개 단위)
+                        _bulk = YouTubeUploader().fetch_analytics_bulk(
+                            [_vid for _, _vid in _targets]
+                        )
                     except Exception as _ex:
-                        log.warning("Analytics 수집 실패 post_id=%d: %s", _post.id, _ex)
-                        _errors += 1
+                        log.warning("Analytics 일괄 수집 실패: %s", _ex)
+                    # 청크 단위 실패는 부분 결과로 돌아오므로 누락된 영상 수로 집계
+                    _errors = sum(1 for _, _vid in _targets if _vid not in _bulk)
+                # 배치 수집 시각 — 모든 행이 동일한 collected_at 공유
+                _now_iso = datetime.now(timezone.utc).isoformat()
+                _updates: list[dict] = []
+                for _row, _video_id in _targets:
+                    _stats = _bulk.get(_video_id)
+                    if not _stats:
+                        continue
+                    _meta = dict(_row["upload_meta"])
+                    _yt = dict(_meta.get("youtube", {}))
+                    _yt["analytics"] = {
+                        **_stats,
+                        "collected_at": _now_iso,
+                    }
+                    _meta["youtube"] = _yt
+                    _cid = _content_ids.get(_row["post_id"])
+                    if _cid:
+                        _updates.append({"id": _cid, "upload_meta": _meta})
+                        _fetched += 1
+                if _updates:
+                    # 행마다 JSON이 달라 단일 UPDATE ... executemany 1회로 반영
+                    _s.bulk_update_mappings(Content, _updates)
+                    _s.commit()
             if _fetched:
+                _clear_analytics_cache()
                 st.success(f"✅ {_fetched}건 수집 완료" + (f" ({_errors}건 실패)" if _errors else ""))
                 st.rerun()
             else:
                 st.warning("수집된 데이터가 없습니다. YouTube 인증 정보를 확인하세요.")
 
+
+def render() -> None:
+    """분석 탭 렌더링."""
+    # 인사이트/피드백 버튼이 최초 헬스 프로브를 동기 대기하지 않도록 미리 갱신
+    warm_ollama_health()
+
+    st.header("📊 분석")
+
+    # ---------------------------------------------------------------------------
+    # 기간 선택
+    # ---------------------------------------------------------------------------
+    hdr_c1, hdr_c2 = st.columns([4, 1])
+    with hdr_c1:
+        period_days = st.selectbox(
+            "분석 기간",
+            [7, 14, 30],
+            format_func=lambda d: f"최근 {d}일",
+        )
+    with hdr_c2:
+        if st.button("🔄 새로고침", key="analytics_refresh", width="stretch"):
+            st.rerun()
+
+    # 생산성/Top 5/성과 분석 — fragment로 분리해 하단 섹션 상호작용과 독립적으로 재실행
+    _render_metrics(period_days)
+
     # ---------------------------------------------------------------------------
     # 🎯 AI 인사이트
     # ---------------------------------------------------------------------------
@@ -369,11 +656,15 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
         _itask_running = _insight_tasks.get(period_days, {}).get("status") == "running"
 
         if _itask_running:
-            @st.fragment(run_every="10s")
+            # 완료는 Event로 래치 — is_set()이면 즉시 전체 재렌더링, 아니면 스트리밍 중간 결과 표시
+            @st.fragment(run_every="3s")
             def _insight_poller() -> None:
                 _t = _insight_tasks.get(period_days)
-                if _t and _t["status"] in ("done", "error"):
+                if not _t or _t["event"].is_set():
                     st.rerun()  # 완료 시 전체 재렌더링
+                elif _t.get("partial"):
+                    st.caption("🤖 LLM 인사이트 생성 중... (실시간 표시)")
+                    st.markdown(_t["partial"])
                 else:
                     st.info("🤖 LLM 인사이트 생성 중... (자동 갱신)")
             _insight_poller()
@@ -381,29 +672,29 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
         elif _saved_insight:
             st.markdown(_saved_insight)
             if st.button("✨ 인사이트 재생성", key="gen_insight", width="content"):
-                if not _ranked:
+                _inputs = _load_insight_inputs(period_days)
+                if not _inputs[-1]:
                     st.warning("업로드된 영상 데이터가 없습니다.")
                 elif not check_ollama_health():
                     st.error("❌ LLM 서버에 연결할 수 없습니다.")
                 else:
                     st.session_state.pop(_insight_key, None)
                     _submit_insight_task(
-                        period_days, _total_collected, _total_approved,
-                        _total_uploaded, _conversion_rate, _ranked,
+                        period_days, *_inputs,
                         load_pipeline_config().get("llm_model", OLLAMA_MODEL),
                     )
                     st.rerun()
 
         else:
             if st.button("✨ 인사이트 생성", key="gen_insight", width="content", type="primary"):
-                if not _ranked:
+                _inputs = _load_insight_inputs(period_days)
+                if not _inputs[-1]:
                     st.warning("업로드된 영상 데이터가 없습니다.")
                 elif not check_ollama_health():
                     st.error("❌ LLM 서버에 연결할 수 없습니다. 설정 탭에서 Ollama 상태를 확인하세요.")
                 else:
                     _submit_insight_task(
-                        period_days, _total_collected, _total_approved,
-                        _total_uploaded, _conversion_rate, _ranked,
+                        period_days, *_inputs,
                         load_pipeline_config().get("llm_model", OLLAMA_MODEL),
                     )
                     st.rerun()
@@ -415,8 +706,6 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
     st.subheader("🎯 피드백 파이프라인 반영")
 
     with st.container(border=True):
-        from analytics.feedback import load_feedback_config
-
         _fb_cfg = load_feedback_config()
         _fb_updated = _fb_cfg.get("updated_at")
         if _fb_updated:
@@ -448,9 +737,10 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
                     width="stretch",
                     disabled=True,
                 )
-                @st.fragment(run_every="5s")
+                @st.fragment(run_every="30s")
                 def _fb_poller() -> None:
-                    if _feedback_task.get("status") in ("done", "error"):
+                    _evt = _feedback_task.get("event")
+                    if _evt is None or _evt.is_set():
                         st.rerun()
                     else:
                         st.caption("LLM 인사이트 생성 중... (자동 감지)")
@@ -497,14 +787,14 @@ background:{color};border-radius:3px;vertical-align:middle"></span>
     # ---------------------------------------------------------------------------
     st.subheader("🧪 A/B 테스트")
 
-    from analytics.ab_test import (
-        list_tests, create_test, cancel_test,
-        evaluate_group, apply_winner, VARIANT_PRESETS,
-    )
-
-    _ab_tests = list_tests()
-    _active_tests  = [t for t in _ab_tests if t.status == "active"]
-    _done_tests    = [t for t in _ab_tests if t.status == "completed"]
+    # 상태별 버킷 — 1회 순회로 분류 (그 외 상태는 버림)
+    _ab_buckets: dict[str, list] = {"active": [], "completed": []}
+    for _t in list_tests():
+        _bucket = _ab_buckets.get(_t.status)
+        if _bucket is not None:
+            _bucket.append(_t)
+    _active_tests = _ab_buckets["active"]
+    _done_tests = _ab_buckets["completed"]
 
     # ── 진행 중인 테스트 ──────────────────────────────────────────────────────
     with st.container(border=True):
@@ -1,11 +1,19 @@
 """편집실 (Editor) 탭."""
 
+import hashlib
+import json
 import logging
-import threading
 import time as _perf_time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
+import pandas as pd
 import streamlit as st
+from sqlalchemy import update as _sql_update
 
 from config.settings import load_pipeline_config, MEDIA_DIR, ASSETS_DIR
 from db.models import Post, PostStatus, Content, ScriptData
@@ -13,9 +21,10 @@ from db.session import SessionLocal
 
 from dashboard.components.status_utils import (
     to_kst, stats_display, check_ollama_health, update_status, delete_post,
+    top_comments, warm_ollama_health, peek_ollama_health,
 )
 from dashboard.components.image_slider import render_image_slider
-from dashboard.components.style_presets import load_style_presets
+from dashboard.components.style_presets import load_style_preset_map
 from dashboard.workers.editor_tasks import (
     get_llm_task, get_tts_task,
     clear_llm_task, clear_tts_task,
@@ -24,6 +33,21 @@ from dashboard.workers.editor_tasks import (
 
 log = logging.getLogger(__name__)
 
+# 삭제/상태 전환 등 fire-and-forget DB 작업용 공유 풀 (클릭마다 스레드 생성 방지)
+_bg_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="editor-bg")
+
+
+def _log_bg_failure(fut: Future) -> None:
+    """백그라운드 작업 예외를 로그로 남긴다 (조용한 실패 방지)."""
+    exc = fut.exception()
+    if exc is not None:
+        log.error("편집실 백그라운드 작업 실패: %s", exc, exc_info=exc)
+
+
+def _submit_bg(fn, *args) -> None:
+    """DB 작업을 공유 풀에 제출하고 실패 시 로그를 남긴다."""
+    _bg_pool.submit(fn, *args).add_done_callback(_log_bg_failure)
+
 
 def _safe_rerun_fragment() -> None:
     """fragment rerun 컨텍스트에서만 scope='fragment' 사용, 아니면 전체 rerun."""
@@ -37,25 +61,112 @@ def _safe_rerun_fragment() -> None:
 # 탭 전용 헬퍼
 # ---------------------------------------------------------------------------
 
-def _suggest_bgm(mood: str) -> str:
-    """mood에 맞는 BGM 파일명을 탐색 후 반환한다. 없으면 '없음'."""
+# mood별 BGM 파일명 키워드 (앞쪽 키워드 우선)
+_BGM_MOOD_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "shocking":     ("tense", "dramatic", "shock", "shocking"),
+    "funny":        ("funny", "upbeat", "comic", "light"),
+    "serious":      ("serious", "calm", "news", "neutral"),
+    "heartwarming": ("warm", "heartwarming", "sweet", "soft"),
+}
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _bgm_index(mtime: float) -> dict[str, str]:
+    """bgm 디렉터리를 1회 스캔해 {mood: 파일명} 매핑 생성.
+
+    mtime(디렉터리 수정 시각)이 캐시 키 — 파일 추가/삭제 시 자동 재스캔.
+    매칭 키워드가 없는 mood와 "" 키는 첫 번째 파일로 대체한다.
+    cache_resource로 공유 dict를 그대로 반환하므로 (조회마다 unpickle 없음) 수정 금지.
+    """
     bgm_dir = ASSETS_DIR / "bgm"
-    if not bgm_dir.exists():
-        return "없음"
     all_files = list(bgm_dir.glob("*.mp3")) + list(bgm_dir.glob("*.wav"))
     if not all_files:
+        return {}
+    stems = [(f.stem.lower(), f.name) for f in all_files]
+    index: dict[str, str] = {"": all_files[0].name}
+    for mood, keywords in _BGM_MOOD_KEYWORDS.items():
+        index[mood] = next(
+            (name for kw in keywords for stem, name in stems if kw in stem),
+            all_files[0].name,
+        )
+    return index
+
+
+def _suggest_bgm(mood: str) -> str:
+    """mood에 맞는 BGM 파일명을 반환한다. 없으면 '없음'."""
+    bgm_dir = ASSETS_DIR / "bgm"
+    try:
+        mtime = bgm_dir.stat().st_mtime
+    except OSError:
         return "없음"
-    mood_keywords: dict[str, list[str]] = {
-        "shocking":     ["tense", "dramatic", "shock", "shocking"],
-        "funny":        ["funny", "upbeat", "comic", "light"],
-        "serious":      ["serious", "calm", "news", "neutral"],
-        "heartwarming": ["warm", "heartwarming", "sweet", "soft"],
-    }
-    for kw in mood_keywords.get(mood, []):
-        for f in all_files:
-            if kw in f.stem.lower():
-                return f.name
-    return all_files[0].name  # 매칭 없으면 첫 번째 파일
+    index = _bgm_index(mtime)
+    return index.get(mood) or index.get("", "없음")
+
+
+@lru_cache(maxsize=64)
+def _parse_script(content_id: int, raw: str) -> ScriptData | None:
+    """summary_text → ScriptData (content 행·원문이 같으면 파싱 결과 재사용).
+
+    반환 객체는 캐시와 공유되므로 읽기 전용으로만 사용한다. 파싱 실패 시 None.
+    """
+    try:
+        return ScriptData.from_json(raw)
+    except Exception:
+        return None
+
+
+def _scene_line_lists(scenes: tuple[str, ...]) -> list[list[str]]:
+    """씬별 정규화된 줄 목록 — 줄당 strip 1회, 빈 줄 제거 (빈 씬은 빈 리스트)."""
+    return [[l for l in map(str.strip, _txt.splitlines()) if l] for _txt in scenes]
+
+
+@lru_cache(maxsize=16)
+def _scene_lines(scenes: tuple[str, ...]) -> tuple[str, ...]:
+    """미리듣기·길이 표시용 씬별 한 줄 텍스트 (빈 씬 제외).
+
+    씬 입력이 그대로면(훅·제목 등만 수정한 rerun) 캐시 결과를 재사용한다.
+    """
+    return tuple(" ".join(_ls) for _ls in _scene_line_lists(scenes) if _ls)
+
+
+def _scene_items(
+    scenes: tuple[str, ...], authors: tuple[str, ...] | None = None,
+) -> list[dict]:
+    """씬 텍스트 → ScriptData.body V2 항목 (저장/확정 시에만 호출).
+
+    authors가 주어지면 comment 타입으로 만든다.
+    """
+    items: list[dict] = []
+    for _i, _sc_lines in enumerate(_scene_line_lists(scenes)):
+        if not _sc_lines:
+            continue
+        if authors is None:
+            items.append({"type": "body", "line_count": len(_sc_lines), "lines": _sc_lines})
+        else:
+            items.append({
+                "type": "comment", "author": authors[_i] if _i < len(authors) else "",
+                "line_count": len(_sc_lines), "lines": _sc_lines,
+            })
+    return items
+
+
+def _script_hash(raw: str) -> bytes:
+    """대본 JSON 지문 (blake2b 16바이트)."""
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_top_comments(post_id: int, fingerprint: str) -> list[dict]:
+    """게시글 베스트 댓글 상위 5개 (좋아요 내림차순).
+
+    fingerprint가 바뀌면 TTL과 무관하게 재조회된다.
+    캐시 직렬화를 위해 ORM 객체 대신 plain dict로 반환한다.
+    """
+    with SessionLocal() as _db:
+        return [
+            {"author": c.author, "content": c.content, "likes": c.likes}
+            for c in top_comments(post_id, _db, limit=5)
+        ]
 
 
 def _split_body_items(body: list) -> tuple[list[str], list[dict]]:
@@ -76,26 +187,388 @@ def _split_body_items(body: list) -> tuple[list[str], list[dict]]:
     return body_strs, comment_dicts
 
 
+_LAYOUT_PATH = Path("config/layout.json")
+
+
+@lru_cache(maxsize=2)
+def _parse_layout_constraints(mtime: float) -> dict:
+    """layout.json의 constraints 섹션 파싱 — mtime이 같으면 재사용."""
+    try:
+        return json.loads(_LAYOUT_PATH.read_text(encoding="utf-8")).get("constraints", {})
+    except Exception:
+        return {}
+
+
+def _load_layout_constraints() -> dict:
+    """씬 편집기 글자수/줄수 제한 (파일 변경 시에만 재파싱). 반환 dict는 수정 금지."""
+    try:
+        mtime = _LAYOUT_PATH.stat().st_mtime
+    except OSError:
+        return {}
+    return _parse_layout_constraints(mtime)
+
+
+class _SceneKeys(NamedTuple):
+    """씬 1개의 위젯 키 묶음 — {prefix}_{pid}_{i}_{suffix} 문자열을 씬당 1회만 생성."""
+    nl: str
+    l0: str
+    l1: str
+    l2: str
+    author: str
+
+
+def _scene_keys(prefix: str, pid: int, idx: int) -> _SceneKeys:
+    """idx번째 씬의 위젯 키 묶음."""
+    _base = f"{prefix}_{pid}_{idx}_"
+    return _SceneKeys(
+        _base + "nlines", _base + "L0", _base + "L1", _base + "L2", _base + "author",
+    )
+
+
+# 씬 섹션 prefix (본문 / 댓글)
+_SCENE_PREFIXES = ("bscene", "cscene")
+
+# 씬 편집기 고정 라벨 (rerun마다 같은 값)
+_LBL_BODY_SECTION = "📝 본문 항목"
+_LBL_COMMENT_SECTION = "💬 댓글 항목"
+_BTN_PLUS = "＋"
+_BTN_CLOSE = "✕"
+
+# 본문 씬 수가 이보다 많으면 편집기를 표(data_editor) 모드로 시작
+_SCENE_TABLE_THRESHOLD = 8
+
+
+def _scene_key_registry(pid: int, prefix: str) -> set[str]:
+    """(pid, 섹션)별로 생성한 씬 위젯 키 집합 (session_state 전체 스캔 없이 삭제하기 위함)."""
+    return st.session_state.setdefault(f"_scene_keys_{pid}_{prefix}", set())
+
+
+def _register_scene_keys(pid: int, prefix: str, sk: _SceneKeys) -> None:
+    """씬 1개의 위젯 키를 레지스트리에 등록."""
+    _scene_key_registry(pid, prefix).update(sk)
+
+
+def _bulk_del_state(keys: Iterable[str]) -> None:
+    """session_state 키 일괄 삭제 — pop 메서드를 1회만 바인딩 (없는 키는 무시)."""
+    _pop = st.session_state.pop
+    for _k in keys:
+        _pop(_k, None)
+
+
+def _clear_scene_keys(pid: int, prefix: str | None = None) -> None:
+    """등록된 씬 위젯 키 삭제 — prefix 지정 시 해당 섹션(bscene/cscene)만."""
+    for _p in (prefix,) if prefix else _SCENE_PREFIXES:
+        _reg = _scene_key_registry(pid, _p)
+        _bulk_del_state(_reg)
+        _reg.clear()
+
+
 def _collect_scenes(pid: int, n: int, prefix: str = "bscene") -> list[str]:
     """씬 편집기의 현재 입력 값을 수집. prefix로 body(bscene)/comment(cscene) 구분."""
+    _get = st.session_state.get
+    _prefix = f"{prefix}_{pid}_"
     result: list[str] = []
     for _i in range(n):
-        _nl = st.session_state.get(f"{prefix}_{pid}_{_i}_nlines", 1)
-        _l0 = st.session_state.get(f"{prefix}_{pid}_{_i}_L0", "")
-        _l1 = st.session_state.get(f"{prefix}_{pid}_{_i}_L1", "")
-        _l2 = st.session_state.get(f"{prefix}_{pid}_{_i}_L2", "")
-        parts = [_l0]
-        if _nl >= 2 and _l1:
-            parts.append(_l1)
-        if _nl >= 3 and _l2:
-            parts.append(_l2)
+        _base = f"{_prefix}{_i}_"
+        _nl = _get(_base + "nlines", 1)
+        parts = [_get(_base + "L0", "")]
+        # 표시 중인 줄만 읽는다 (숨겨진 줄 키 조회 생략)
+        if _nl >= 2:
+            _l1 = _get(_base + "L1", "")
+            if _l1:
+                parts.append(_l1)
+        if _nl >= 3:
+            _l2 = _get(_base + "L2", "")
+            if _l2:
+                parts.append(_l2)
         result.append("\n".join(parts))
     return result
 
 
 def _collect_authors(pid: int, n: int, prefix: str = "cscene") -> list[str]:
     """댓글 씬의 작성자 값을 수집."""
-    return [st.session_state.get(f"{prefix}_{pid}_{_i}_author", "") for _i in range(n)]
+    _get = st.session_state.get
+    _prefix = f"{prefix}_{pid}_"
+    return [_get(f"{_prefix}{_i}_author", "") for _i in range(n)]
+
+
+def _rebuild_scene_keys(
+    cur: list[str],
+    authors: list[str] | None,
+    *,
+    pid: int,
+    prefix: str,
+    scenes_key: str,
+    cak_key: str,
+    max_lines: int,
+) -> None:
+    """한 섹션의 씬 키를 전체 재구성. authors는 댓글 섹션에서만 전달."""
+    _clear_scene_keys(pid, prefix)
+    st.session_state[scenes_key] = cur
+    _rkeys = [_scene_keys(prefix, pid, _ri) for _ri in range(len(cur))]
+    for _rsk, _rt in zip(_rkeys, cur):
+        _parts = [l for l in _rt.splitlines() if l][:max_lines]
+        _register_scene_keys(pid, prefix, _rsk)
+        st.session_state[_rsk.nl] = len(_parts) or 1
+        st.session_state[_rsk.l0] = _parts[0] if _parts else ""
+        st.session_state[_rsk.l1] = _parts[1] if len(_parts) > 1 else ""
+        if max_lines >= 3:
+            st.session_state[_rsk.l2] = _parts[2] if len(_parts) > 2 else ""
+    if authors is not None:
+        st.session_state[cak_key] = authors
+        # authors는 cur와 함께 삽입/삭제되므로 길이가 같다
+        for _rsk, _a in zip(_rkeys, authors):
+            st.session_state[_rsk.author] = _a
+
+
+def _render_scene_list(
+    scenes_key: str,
+    prefix: str,
+    label: str,
+    show_author: bool,
+    *,
+    pid: int,
+    cak_key: str,
+    max_chars: int,
+    max_lines: int,
+) -> None:
+    """body 또는 comment 한 섹션의 씬 리스트를 렌더링하고 액션을 처리."""
+    _scenes: list[str] = st.session_state[scenes_key]
+    _n = len(_scenes)
+
+    # 씬 키 초기화 — 현재 씬 수만큼 이미 초기화됐으면 키별 존재 확인 루프 생략.
+    # 초기화 완료 표시 키도 레지스트리에 등록되므로 키 삭제/재구성 시 함께 무효화된다.
+    # 다른 게시글로 이동하면 렌더되지 않은 위젯 상태를 Streamlit이 정리하므로 첫 씬 L0 키로 확인
+    _keys = [_scene_keys(prefix, pid, _i) for _i in range(_n)]
+    _init_key = f"_scene_init_{pid}_{prefix}"
+    _init_done = (
+        st.session_state.get(_init_key) == _n
+        and (not _n or _keys[0].l0 in st.session_state)
+    )
+    for _i, _st_txt in enumerate(() if _init_done else _scenes):
+        _sk = _keys[_i]
+        if _sk.nl not in st.session_state:
+            _parts = [l for l in _st_txt.splitlines() if l][:max_lines]
+            _nl = len(_parts) or 1
+            _register_scene_keys(pid, prefix, _sk)
+            st.session_state[_sk.nl] = _nl
+            st.session_state[_sk.l0] = _parts[0] if len(_parts) > 0 else ""
+            st.session_state[_sk.l1] = _parts[1] if len(_parts) > 1 else ""
+            if max_lines >= 3:
+                st.session_state[_sk.l2] = _parts[2] if len(_parts) > 2 else ""
+        if show_author and _sk.author not in st.session_state:
+            _register_scene_keys(pid, prefix, _sk)
+            _authors = st.session_state.get(cak_key, [])
+            st.session_state[_sk.author] = _authors[_i] if _i < len(_authors) else ""
+    if not _init_done:
+        _scene_key_registry(pid, prefix).add(_init_key)
+        st.session_state[_init_key] = _n
+
+    st.markdown(f"**{label}** — 씬 단위 편집 (줄당 {max_chars}자, 씬당 최대 {max_lines}줄)")
+    # 줄 입력 placeholder는 섹션당 1회만 포맷 (씬마다 f-string 재생성 방지)
+    _ph = tuple(f"줄 {_j} (최대 {max_chars}자)" for _j in (1, 2, 3))
+
+    _del_idx: int | None = None
+    _add_line_idx: int | None = None
+    _del_line_idx: int | None = None
+    _insert_idx: int | None = None
+
+    # 맨 위 삽입 버튼
+    _p1, _p2, _p3 = st.columns([5, 2, 5])
+    with _p2:
+        if st.button(_BTN_PLUS, key=f"ins_{prefix}_{pid}_0", help="씬 삽입"):
+            _insert_idx = 0
+
+    for _si in range(_n):
+        _sk = _keys[_si]
+        _l0k, _l1k, _l2k = _sk.l0, _sk.l1, _sk.l2
+        _nl = st.session_state.get(_sk.nl, 1)
+
+        with st.container(border=True):
+            # 첫 행에 씬 제목(입력 라벨)·줄 추가·씬 삭제를 함께 배치 — 별도 헤더 행 제거
+            # 본문: 첫 행 = 줄 1 / 댓글: 첫 행 = 작성자, 줄 1은 다음 행
+            _fc, _ac, _dc = st.columns([8, 1, 1], vertical_alignment="bottom")
+            with _fc:
+                if show_author:
+                    st.text_input(
+                        f"씬 {_si + 1} · 작성자", key=_sk.author,
+                        max_chars=20, placeholder="작성자 닉네임",
+                    )
+                else:
+                    st.text_input(
+                        f"씬 {_si + 1}", key=_l0k, max_chars=max_chars,
+                        placeholder=_ph[0],
+                    )
+            with _ac:
+                if not show_author and _nl == 1 and st.button(
+                    _BTN_PLUS, key=f"aln_{prefix}_{pid}_{_si}", help="줄 추가",
+                ):
+                    _add_line_idx = _si
+            with _dc:
+                if st.button(_BTN_CLOSE, key=f"dsc_{prefix}_{pid}_{_si}", help="씬 삭제"):
+                    _del_idx = _si
+
+            if show_author:
+                if _nl == 1:
+                    _lc, _bc = st.columns([9, 1])
+                    with _lc:
+                        st.text_input(
+                            "줄 1", key=_l0k, max_chars=max_chars,
+                            label_visibility="collapsed",
+                            placeholder=_ph[0],
+                        )
+                    with _bc:
+                        if st.button(
+                            _BTN_PLUS, key=f"aln_{prefix}_{pid}_{_si}",
+                            help="줄 추가",
+                        ):
+                            _add_line_idx = _si
+                else:
+                    st.text_input(
+                        "줄 1", key=_l0k, max_chars=max_chars,
+                        label_visibility="collapsed",
+                        placeholder=_ph[0],
+                    )
+
+            if _nl >= 2:
+                _show_add_btn = _nl < max_lines
+                _l2c, _dlc = st.columns([9, 1])
+                with _l2c:
+                    st.text_input(
+                        "줄 2", key=_l1k, max_chars=max_chars,
+                        label_visibility="collapsed",
+                        placeholder=_ph[1],
+                    )
+                with _dlc:
+                    if _show_add_btn:
+                        if st.button(
+                            _BTN_PLUS, key=f"aln2_{prefix}_{pid}_{_si}",
+                            help="줄 추가",
+                        ):
+                            _add_line_idx = _si
+                    else:
+                        if st.button(
+                            _BTN_CLOSE, key=f"dln_{prefix}_{pid}_{_si}",
+                            help="줄 삭제",
+                        ):
+                            _del_line_idx = _si
+
+            if _nl >= 3:
+                _l3c, _dl3c = st.columns([9, 1])
+                with _l3c:
+                    st.text_input(
+                        "줄 3", key=_l2k, max_chars=max_chars,
+                        label_visibility="collapsed",
+                        placeholder=_ph[2],
+                    )
+                with _dl3c:
+                    if st.button(
+                        _BTN_CLOSE, key=f"dln3_{prefix}_{pid}_{_si}",
+                        help="줄 삭제",
+                    ):
+                        _del_line_idx = _si
+
+        # 씬 사이 삽입 버튼
+        _p1, _p2, _p3 = st.columns([5, 2, 5])
+        with _p2:
+            if st.button(
+                _BTN_PLUS, key=f"ins_{prefix}_{pid}_{_si + 1}",
+                help="씬 삽입",
+            ):
+                _insert_idx = _si + 1
+
+    # ── 액션 처리 ────────────────────────────────────────────────────────
+    # 현재 입력 값은 분기와 무관하게 1회만 수집
+    _cur = _collect_scenes(pid, _n, prefix)
+    _au: list[str] | None = _collect_authors(pid, _n, prefix) if show_author else None
+
+    if _insert_idx is not None:
+        _cur.insert(_insert_idx, "")
+        if _au is not None:
+            _au.insert(_insert_idx, "")
+        _rebuild_scene_keys(
+            _cur, _au, pid=pid, prefix=prefix, scenes_key=scenes_key,
+            cak_key=cak_key, max_lines=max_lines,
+        )
+        st.rerun(scope="fragment")
+    elif _add_line_idx is not None:
+        st.session_state[scenes_key] = _cur
+        _ank = _keys[_add_line_idx].nl
+        st.session_state[_ank] = min(st.session_state.get(_ank, 1) + 1, max_lines)
+        st.rerun(scope="fragment")
+    elif _del_line_idx is not None:
+        # 마지막 줄 제거
+        _txt = _cur[_del_line_idx]
+        _parts = _txt.splitlines() or [""]
+        if len(_parts) > 1:
+            _parts.pop()
+        _cur[_del_line_idx] = "\n".join(_parts)
+        _rebuild_scene_keys(
+            _cur, _au, pid=pid, prefix=prefix, scenes_key=scenes_key,
+            cak_key=cak_key, max_lines=max_lines,
+        )
+        st.rerun(scope="fragment")
+    elif _del_idx is not None:
+        _cur.pop(_del_idx)
+        if _au is not None and _del_idx < len(_au):
+            _au.pop(_del_idx)
+        # body: 최소 1씬 유지 / comment: 빈 리스트 허용
+        if not show_author and not _cur:
+            _cur = [""]
+        _rebuild_scene_keys(
+            _cur, _au, pid=pid, prefix=prefix, scenes_key=scenes_key,
+            cak_key=cak_key, max_lines=max_lines,
+        )
+        st.rerun(scope="fragment")
+    else:
+        st.session_state[scenes_key] = _cur
+        if _au is not None:
+            st.session_state[cak_key] = _au
+
+
+def _render_scene_table(
+    scenes_key: str,
+    prefix: str,
+    label: str,
+    *,
+    pid: int,
+    max_chars: int,
+    max_lines: int,
+) -> None:
+    """씬 리스트를 st.data_editor 표 하나로 편집 (씬별 위젯 대신 단일 컴포넌트).
+
+    data_editor는 입력 데이터 대비 변경분을 위젯 상태로 보관하므로, 표 모드 진입 시점의
+    씬 목록을 기준 데이터로 고정하고 편집 결과만 scenes_key에 반영한다.
+    기준 데이터·표 위젯 키는 씬 키 레지스트리에 등록해 모드 전환·AI 결과 주입 시 함께 삭제된다.
+    """
+    _cols = [f"줄 {_i + 1}" for _i in range(max_lines)]
+    _base_key = f"{prefix}_{pid}_table_base"
+    _table_key = f"{prefix}_{pid}_table"
+    if _base_key not in st.session_state:
+        _rows = []
+        for _txt in st.session_state[scenes_key]:
+            _parts = [l for l in _txt.splitlines() if l][:max_lines]
+            _rows.append(_parts + [""] * (max_lines - len(_parts)))
+        st.session_state[_base_key] = _rows
+        _scene_key_registry(pid, prefix).update((_base_key, _table_key))
+
+    st.markdown(f"**{label}** — 표 편집 (줄당 {max_chars}자, 씬당 최대 {max_lines}줄, 행 = 씬)")
+    _edited = st.data_editor(
+        pd.DataFrame(st.session_state[_base_key], columns=_cols),
+        num_rows="dynamic",
+        width="stretch",
+        column_config={
+            _c: st.column_config.TextColumn(_c, max_chars=max_chars) for _c in _cols
+        },
+        key=_table_key,
+    )
+    # 새로 추가된 행의 빈 셀은 None/NaN — 문자열만 줄로 취급
+    _cur = [
+        "\n".join(_v.strip() for _v in _row if isinstance(_v, str) and _v.strip())
+        for _row in _edited.itertuples(index=False)
+    ]
+    # 본문은 최소 1씬 유지
+    st.session_state[scenes_key] = _cur or [""]
 
 
 @st.fragment
@@ -114,9 +587,7 @@ def _scene_editor_frag(pid: int, init_body: list) -> None:
 
     # 초기화: 둘 다 있어야 함 (하위 호환: 기존 body_scenes만 있으면 재초기화)
     if _bsk not in st.session_state or _csk not in st.session_state:
-        for _dk in list(st.session_state.keys()):
-            if _dk.startswith(f"bscene_{pid}_") or _dk.startswith(f"cscene_{pid}_"):
-                del st.session_state[_dk]
+        _clear_scene_keys(pid)
         _body_strs, _comment_dicts = _split_body_items(init_body)
         st.session_state[_bsk] = _body_strs if _body_strs else [""]
         st.session_state[_csk] = (
@@ -126,240 +597,40 @@ def _scene_editor_frag(pid: int, init_body: list) -> None:
             [d["author"] for d in _comment_dicts] if _comment_dicts else []
         )
 
-    # ── layout.json에서 글자수 제한 로드 ────────────────────────────────────
-    import json as _json
-    _layout_path = Path("config/layout.json")
-    try:
-        _layout_data = _json.loads(_layout_path.read_text(encoding="utf-8"))
-        _layout_constraints = _layout_data.get("constraints", {})
-    except Exception:
-        _layout_constraints = {}
+    # ── layout.json에서 글자수 제한 로드 (mtime 기준 캐시) ──────────────────
+    _layout_constraints = _load_layout_constraints()
     _BODY_MAX_CHARS: int = _layout_constraints.get("body_line", {}).get("max_chars", 21)
     _BODY_MAX_LINES: int = _layout_constraints.get("body_line", {}).get("max_lines", 2)
     _COMMENT_MAX_CHARS: int = _layout_constraints.get("comment_line", {}).get("max_chars", 20)
     _COMMENT_MAX_LINES: int = _layout_constraints.get("comment_line", {}).get("max_lines", 3)
 
-    # ── 공통 씬 리스트 렌더 함수 ─────────────────────────────────────────────
-    def _render_scene_list(
-        scenes_key: str,
-        prefix: str,
-        label: str,
-        show_author: bool,
-    ) -> None:
-        """body 또는 comment 한 섹션의 씬 리스트를 렌더링하고 액션을 처리."""
-        _max_chars = _COMMENT_MAX_CHARS if show_author else _BODY_MAX_CHARS
-        _max_lines = _COMMENT_MAX_LINES if show_author else _BODY_MAX_LINES
-        _scenes: list[str] = st.session_state[scenes_key]
-        _n = len(_scenes)
-
-        # 씬 키 초기화
-        for _i, _st_txt in enumerate(_scenes):
-            _nk = f"{prefix}_{pid}_{_i}_nlines"
-            if _nk not in st.session_state:
-                _parts = [l for l in _st_txt.split("\n") if l]
-                _nl = min(len(_parts), _max_lines) if _parts else 1
-                st.session_state[_nk] = _nl
-                st.session_state[f"{prefix}_{pid}_{_i}_L0"] = (
-                    _parts[0] if len(_parts) > 0 else ""
-                )
-                st.session_state[f"{prefix}_{pid}_{_i}_L1"] = (
-                    _parts[1] if len(_parts) > 1 else ""
-                )
-                if _max_lines >= 3:
-                    st.session_state[f"{prefix}_{pid}_{_i}_L2"] = (
-                        _parts[2] if len(_parts) > 2 else ""
-                    )
-            if show_author and f"{prefix}_{pid}_{_i}_author" not in st.session_state:
-                _authors = st.session_state.get(_cak, [])
-                st.session_state[f"{prefix}_{pid}_{_i}_author"] = (
-                    _authors[_i] if _i < len(_authors) else ""
-                )
-
-        st.markdown(f"**{label}** — 씬 단위 편집 (줄당 {_max_chars}자, 씬당 최대 {_max_lines}줄)")
-
-        _del_idx: int | None = None
-        _add_line_idx: int | None = None
-        _del_line_idx: int | None = None
-        _insert_idx: int | None = None
-
-        # 맨 위 삽입 버튼
-        _p1, _p2, _p3 = st.columns([5, 2, 5])
-        with _p2:
-            if st.button("＋", key=f"ins_{prefix}_{pid}_0", help="씬 삽입"):
-                _insert_idx = 0
-
-        for _si in range(_n):
-            _nk = f"{prefix}_{pid}_{_si}_nlines"
-            _l0k = f"{prefix}_{pid}_{_si}_L0"
-            _l1k = f"{prefix}_{pid}_{_si}_L1"
-            _l2k = f"{prefix}_{pid}_{_si}_L2"
-            _nl = st.session_state.get(_nk, 1)
-
-            with st.container(border=True):
-                _hc, _dc = st.columns([9, 1])
-                with _hc:
-                    st.markdown(f"**씬 {_si + 1}**")
-                with _dc:
-                    if st.button("✕", key=f"dsc_{prefix}_{pid}_{_si}", help="씬 삭제"):
-                        _del_idx = _si
-
-                # 작성자 필드 (댓글 전용)
-                if show_author:
-                    st.text_input(
-                        "작성자", key=f"{prefix}_{pid}_{_si}_author",
-                        max_chars=20, placeholder="작성자 닉네임",
-                    )
-
-                if _nl == 1:
-                    _lc, _bc = st.columns([9, 1])
-                    with _lc:
-                        st.text_input(
-                            "줄 1", key=_l0k, max_chars=_max_chars,
-                            label_visibility="collapsed",
-                            placeholder=f"줄 1 (최대 {_max_chars}자)",
-                        )
-                    with _bc:
-                        if st.button(
-                            "＋", key=f"aln_{prefix}_{pid}_{_si}",
-                            help="줄 추가",
-                        ):
-                            _add_line_idx = _si
-                else:
-                    st.text_input(
-                        "줄 1", key=_l0k, max_chars=_max_chars,
-                        label_visibility="collapsed",
-                        placeholder=f"줄 1 (최대 {_max_chars}자)",
-                    )
-
-                if _nl >= 2:
-                    _show_add_btn = _nl < _max_lines
-                    _l2c, _dlc = st.columns([9, 1])
-                    with _l2c:
-                        st.text_input(
-                            "줄 2", key=_l1k, max_chars=_max_chars,
-                            label_visibility="collapsed",
-                            placeholder=f"줄 2 (최대 {_max_chars}자)",
-                        )
-                    with _dlc:
-                        if _show_add_btn:
-                            if st.button(
-                                "＋", key=f"aln2_{prefix}_{pid}_{_si}",
-                                help="줄 추가",
-                            ):
-                                _add_line_idx = _si
-                        else:
-                            if st.button(
-                                "✕", key=f"dln_{prefix}_{pid}_{_si}",
-                                help="줄 삭제",
-                            ):
-                                _del_line_idx = _si
-
-                if _nl >= 3:
-                    _l3c, _dl3c = st.columns([9, 1])
-                    with _l3c:
-                        st.text_input(
-                            "줄 3", key=_l2k, max_chars=_max_chars,
-                            label_visibility="collapsed",
-                            placeholder=f"줄 3 (최대 {_max_chars}자)",
-                        )
-                    with _dl3c:
-                        if st.button(
-                            "✕", key=f"dln3_{prefix}_{pid}_{_si}",
-                            help="줄 삭제",
-                        ):
-                            _del_line_idx = _si
-
-            # 씬 사이 삽입 버튼
-            _p1, _p2, _p3 = st.columns([5, 2, 5])
-            with _p2:
-                if st.button(
-                    "＋", key=f"ins_{prefix}_{pid}_{_si + 1}",
-                    help="씬 삽입",
-                ):
-                    _insert_idx = _si + 1
-
-        # ── 액션 처리 ────────────────────────────────────────────────────────
-        def _rebuild_keys(cur: list[str], authors: list[str] | None = None) -> None:
-            """씬 키를 전체 재구성."""
-            for _dk in list(st.session_state.keys()):
-                if _dk.startswith(f"{prefix}_{pid}_"):
-                    del st.session_state[_dk]
-            st.session_state[scenes_key] = cur
-            for _ri, _rt in enumerate(cur):
-                _parts = [l for l in _rt.split("\n") if l]
-                _nl2 = min(len(_parts), _max_lines) if _parts else 1
-                st.session_state[f"{prefix}_{pid}_{_ri}_nlines"] = _nl2
-                st.session_state[f"{prefix}_{pid}_{_ri}_L0"] = (
-                    _parts[0] if _parts else ""
-                )
-                st.session_state[f"{prefix}_{pid}_{_ri}_L1"] = (
-                    _parts[1] if len(_parts) > 1 else ""
-                )
-                if _max_lines >= 3:
-                    st.session_state[f"{prefix}_{pid}_{_ri}_L2"] = (
-                        _parts[2] if len(_parts) > 2 else ""
-                    )
-            if show_author and authors is not None:
-                st.session_state[_cak] = authors
-                for _ri, _a in enumerate(authors):
-                    st.session_state[f"{prefix}_{pid}_{_ri}_author"] = _a
-
-        if _insert_idx is not None:
-            _cur = _collect_scenes(pid, _n, prefix)
-            _cur.insert(_insert_idx, "")
-            _au: list[str] | None = None
-            if show_author:
-                _au = _collect_authors(pid, _n, prefix)
-                _au.insert(_insert_idx, "")
-            _rebuild_keys(_cur, _au)
-            st.rerun(scope="fragment")
-        elif _add_line_idx is not None:
-            st.session_state[scenes_key] = _collect_scenes(pid, _n, prefix)
-            _cur_nl = st.session_state.get(f"{prefix}_{pid}_{_add_line_idx}_nlines", 1)
-            _new_nl = min(_cur_nl + 1, _max_lines)
-            st.session_state[f"{prefix}_{pid}_{_add_line_idx}_nlines"] = _new_nl
-            st.rerun(scope="fragment")
-        elif _del_line_idx is not None:
-            _cur = _collect_scenes(pid, _n, prefix)
-            # 마지막 줄 제거
-            _txt = _cur[_del_line_idx]
-            _parts = _txt.split("\n") if _txt else [""]
-            if len(_parts) > 1:
-                _parts.pop()
-            _cur[_del_line_idx] = "\n".join(_parts)
-            _au = None
-            if show_author:
-                _au = _collect_authors(pid, _n, prefix)
-            _rebuild_keys(_cur, _au)
-            st.rerun(scope="fragment")
-        elif _del_idx is not None:
-            _cur = _collect_scenes(pid, _n, prefix)
-            _cur.pop(_del_idx)
-            _au = None
-            if show_author:
-                _au = _collect_authors(pid, _n, prefix)
-                if _del_idx < len(_au):
-                    _au.pop(_del_idx)
-            # body: 최소 1씬 유지 / comment: 빈 리스트 허용
-            if not show_author and not _cur:
-                _cur = [""]
-            if show_author and _au is not None and not _au and not _cur:
-                pass  # 댓글 전체 삭제 허용
-            _rebuild_keys(_cur, _au)
-            st.rerun(scope="fragment")
-        else:
-            st.session_state[scenes_key] = _collect_scenes(pid, _n, prefix)
-            if show_author:
-                st.session_state[_cak] = _collect_authors(pid, _n, prefix)
-
     # ── 본문 섹션 렌더 ───────────────────────────────────────────────────────
-    _render_scene_list(_bsk, "bscene", "📝 본문 항목", show_author=False)
+    # 씬이 많으면 기본으로 표 모드 — 씬별 입력·버튼 위젯 수십 개 대신 data_editor 1개
+    # 전환 시 양쪽 모드의 위젯 키를 비워 현재 body_scenes 기준으로 다시 초기화한다
+    if st.toggle(
+        "📋 표로 편집",
+        value=len(st.session_state[_bsk]) > _SCENE_TABLE_THRESHOLD,
+        key=f"bscene_table_mode_{pid}",
+        on_change=_clear_scene_keys, args=(pid, "bscene"),
+    ):
+        _render_scene_table(
+            _bsk, "bscene", _LBL_BODY_SECTION,
+            pid=pid, max_chars=_BODY_MAX_CHARS, max_lines=_BODY_MAX_LINES,
+        )
+    else:
+        _render_scene_list(
+            _bsk, "bscene", _LBL_BODY_SECTION, show_author=False,
+            pid=pid, cak_key=_cak, max_chars=_BODY_MAX_CHARS, max_lines=_BODY_MAX_LINES,
+        )
 
     # ── 댓글 섹션 렌더 ───────────────────────────────────────────────────────
     _c_scenes = st.session_state.get(_csk, [])
     if _c_scenes:
         st.divider()
-        _render_scene_list(_csk, "cscene", "💬 댓글 항목", show_author=True)
+        _render_scene_list(
+            _csk, "cscene", _LBL_COMMENT_SECTION, show_author=True,
+            pid=pid, cak_key=_cak, max_chars=_COMMENT_MAX_CHARS, max_lines=_COMMENT_MAX_LINES,
+        )
     else:
         _p1, _p2, _p3 = st.columns([3, 4, 3])
         with _p2:
@@ -371,27 +642,81 @@ def _scene_editor_frag(pid: int, init_body: list) -> None:
     st.session_state[f"scene_valid_{pid}"] = True
 
 
+# 분위기 선택지 (편집 필드 selectbox와 AI 결과 검증 공용)
+_MOOD_OPTIONS: tuple[str, ...] = ("funny", "serious", "shocking", "heartwarming")
+_MOOD_SET: frozenset[str] = frozenset(_MOOD_OPTIONS)  # 멤버십 검사용
+
+
 def _inject_ai_result(pid: int, script_data: ScriptData) -> None:
-    """비동기 LLM 결과를 session_state에 주입한다 (다음 rerun에서 위젯에 반영)."""
-    mood_options = ["funny", "serious", "shocking", "heartwarming"]
+    """비동기 LLM 결과를 편집 위젯 키에 직접 기록한다 (위젯 렌더 전에 호출 — 다음 rerun에 반영).
+
+    씬 위젯 키는 삭제해 _scene_editor_frag가 새 body_scenes로 재초기화하게 한다.
+    """
     _body_strs, _comment_dicts = _split_body_items(script_data.body)
-    st.session_state[f"_ai_result_{pid}"] = {
-        "hook":             script_data.hook,
-        "closer":           script_data.closer,
-        "title":            script_data.title_suggestion,
-        "tags":             ", ".join(script_data.tags),
-        "mood":             script_data.mood if script_data.mood in mood_options else "funny",
-        "body_scenes":      _body_strs if _body_strs else [""],
-        "comment_scenes":   [d["text"] for d in _comment_dicts] if _comment_dicts else [],
-        "comment_authors":  [d["author"] for d in _comment_dicts] if _comment_dicts else [],
-    }
-    for _ok in list(st.session_state.keys()):
-        if _ok in (
-            f"hook_{pid}", f"closer_{pid}",
-            f"title_{pid}", f"tags_{pid}", f"mood_{pid}",
-            f"body_scenes_{pid}", f"comment_scenes_{pid}", f"comment_authors_{pid}",
-        ) or _ok.startswith(f"bscene_{pid}_") or _ok.startswith(f"cscene_{pid}_"):
-            del st.session_state[_ok]
+    # 편집 필드 값은 한 번의 update로 기록
+    st.session_state.update({
+        f"hook_{pid}": script_data.hook,
+        f"closer_{pid}": script_data.closer,
+        f"title_{pid}": script_data.title_suggestion,
+        f"tags_{pid}": ", ".join(script_data.tags),
+        f"mood_{pid}": script_data.mood if script_data.mood in _MOOD_SET else "funny",
+        f"body_scenes_{pid}": _body_strs if _body_strs else [""],
+        f"comment_scenes_{pid}": [d["text"] for d in _comment_dicts],
+        f"comment_authors_{pid}": [d["author"] for d in _comment_dicts],
+    })
+    _clear_scene_keys(pid)
+
+
+@st.fragment
+def _preview_tts_frag(pid: int, parts: list[str], char_count: int, cfg: dict) -> None:
+    """예상 길이 표시 + TTS 미리듣기 (parts: 후킹·본문·댓글·마무리 조각, 공백으로 이어 읽음).
+
+    fragment로 분리해 TTS 버튼 클릭/제출 후 재실행이 편집실 전체
+    (게시글·Content DB 조회 포함)로 번지지 않도록 한다.
+    """
+    est_seconds = round(char_count / 5.5)
+    len_color = "green" if 35 <= est_seconds <= 60 else "orange"
+
+    info_c1, info_c2 = st.columns(2)
+    with info_c1:
+        st.markdown(
+            f"⏱️ 예상 길이: :{len_color}[{char_count}자 ≈ **{est_seconds}초**]"
+        )
+        if est_seconds < 35:
+            st.caption("⚠️ 너무 짧습니다 (권장 40~55초)")
+        elif est_seconds > 60:
+            st.caption("⚠️ 너무 깁니다 (권장 40~55초)")
+
+    _tts_task = get_tts_task(pid)
+    _tts_running = _tts_task is not None and _tts_task.get("status") == "running"
+    _has_content = any(p.strip() for p in parts)
+
+    with info_c2:
+        if _tts_running:
+            st.info("🎙️ TTS 생성 중...")
+            st.progress(0.0, text="TTS 처리 대기 중")
+        elif st.button(
+            "▶ TTS 미리듣기", width="stretch",
+            key=f"tts_preview_{pid}",
+            disabled=not _has_content,
+        ):
+            preview_path = MEDIA_DIR / "tmp" / f"preview_{pid}.mp3"
+            submitted = submit_tts_task(
+                pid,
+                text=" ".join(parts),
+                engine_name=cfg["tts_engine"],
+                voice=cfg["tts_voice"],
+                output_path=preview_path,
+            )
+            if submitted:
+                # 전체 rerun — 편집 탭 하단의 작업 모니터 fragment가 등록되도록
+                st.rerun()
+            else:
+                st.info("이미 생성 중입니다.")
+
+    audio_cache_key = f"tts_audio_{pid}"
+    if audio_cache_key in st.session_state:
+        st.audio(st.session_state[audio_cache_key])
 
 
 # ---------------------------------------------------------------------------
@@ -400,6 +725,8 @@ def _inject_ai_result(pid: int, script_data: ScriptData) -> None:
 
 def render() -> None:
     """편집실 탭 렌더링."""
+    # 대본 생성 버튼이 최초 헬스 프로브를 동기 대기하지 않도록 미리 갱신
+    warm_ollama_health()
 
     _ed_hdr, _ed_ref = st.columns([5, 1])
     with _ed_hdr:
@@ -409,58 +736,74 @@ def render() -> None:
             st.session_state["hidden_editor_ids"] = set()
             _safe_rerun_fragment()
 
-    if "editor_idx" not in st.session_state:
-        st.session_state["editor_idx"] = 0
-    if "editor_page_offset" not in st.session_state:
-        st.session_state["editor_page_offset"] = 0
-    if "hidden_editor_ids" not in st.session_state:
-        st.session_state["hidden_editor_ids"] = set()
+    st.session_state.setdefault("editor_idx", 0)
+    st.session_state.setdefault("editor_page_offset", 0)
+    st.session_state.setdefault("hidden_editor_ids", set())
 
     _EDITOR_PAGE_SIZE = 30  # 한 번에 로드할 최대 게시물 수
 
-    # ── 1. 편집 대기 게시글 로드 (페이지네이션 적용) ───────────────────────────
+    # ── 1. 편집 대기 게시글 + 선택 게시글 / Content 로드 (단일 세션) ──────────────
     # 성능: selectinload(Post.comments) 제거 — 30개 전체 댓글 로드 → 선택 게시글만 로드
     _t0_db = _perf_time.perf_counter()
     with SessionLocal() as _ds:
-        _total_editing = (
-            _ds.query(Post)
-            .filter(Post.status == PostStatus.EDITING)
-            .count()
-        )
+        # 목록은 선택 박스용 (id, title) 튜플만 조회 — ORM 객체 생성·JSON 역직렬화 생략
         approved_posts = (
-            _ds.query(Post)
+            _ds.query(Post.id, Post.title)
             .filter(Post.status == PostStatus.EDITING)
             .order_by(Post.created_at.desc())
             .offset(st.session_state["editor_page_offset"])
-            .limit(_EDITOR_PAGE_SIZE)
+            .limit(_EDITOR_PAGE_SIZE + 1)  # 1건 더 조회해 COUNT 없이 "더 있음" 판별
             .all()
         )
+        _has_more = len(approved_posts) > _EDITOR_PAGE_SIZE
+        approved_posts = approved_posts[:_EDITOR_PAGE_SIZE]
+
+        # 낙관적 UI — 자동생성으로 전송한 게시글은 즉시 목록에서 제외
+        _hidden = st.session_state["hidden_editor_ids"]
+        approved_posts = [p for p in approved_posts if p.id not in _hidden]
+
+        if not approved_posts:
+            st.info("✏️ 편집 대기 게시글이 없습니다. 수신함에서 먼저 승인하세요.")
+            return
+
+        n_posts = len(approved_posts)
+        idx = min(st.session_state["editor_idx"], n_posts - 1)
+        selected_post_id = approved_posts[idx].id
+        _pid = selected_post_id
+
+        # 전체 행은 선택 게시글 1건만 로드
+        selected_post = _ds.get(Post, selected_post_id)
+        if selected_post is None:
+            # 목록 조회 직후 다른 세션에서 삭제됨
+            st.session_state["hidden_editor_ids"].add(selected_post_id)
+            st.warning("선택한 게시글이 삭제되었습니다. 새로고침하세요.")
+            return
+        existing_content = (
+            _ds.query(Content)
+            .filter(Content.post_id == selected_post_id)
+            .first()
+        )
+        script_data: ScriptData | None = None
+        if existing_content and existing_content.summary_text:
+            script_data = _parse_script(existing_content.id, existing_content.summary_text)
+        # 현재 DB 대본 지문 — 저장 시 동일 내용이면 UPDATE 생략
+        st.session_state[f"_saved_hash_{selected_post_id}"] = (
+            _script_hash(existing_content.summary_text)
+            if existing_content and existing_content.summary_text else None
+        )
+        # 게시글 updated_at을 지문으로 사용 — 재수집으로 댓글이 바뀌면 캐시 키도 바뀐다
+        _comments_fp = selected_post.updated_at.isoformat() if selected_post.updated_at else ""
     _dur_db = (_perf_time.perf_counter() - _t0_db) * 1000
     if _dur_db > 100:
         log.warning("[PERF] editor DB 게시글 로드: %.0fms (SLOW)", _dur_db)
 
-    # 낙관적 UI — 자동생성으로 전송한 게시글은 즉시 목록에서 제외
-    _hidden = st.session_state["hidden_editor_ids"]
-    approved_posts = [p for p in approved_posts if p.id not in _hidden]
-
-    if not approved_posts:
-        st.info("✏️ 편집 대기 게시글이 없습니다. 수신함에서 먼저 승인하세요.")
-        return
-
     # ── 2. 네비게이션 바 ────────────────────────────────────────────────────────
-    n_posts = len(approved_posts)
-    idx = min(st.session_state["editor_idx"], n_posts - 1)
-
-    selected_post = approved_posts[idx]
-    selected_post_id = selected_post.id
-    _pid = selected_post_id
-
-    post_labels = [f"[{p.id}] {p.title[:45]}" for p in approved_posts]
     col_sel, col_del = st.columns([8, 2])
     with col_sel:
         new_idx = st.selectbox(
             "게시글 선택", range(n_posts), index=idx,
-            format_func=lambda i: post_labels[i],
+            # 라벨은 표시 시점에 (id, title) 행에서 바로 포맷 — 라벨 목록을 미리 만들지 않음
+            format_func=lambda i: f"[{approved_posts[i].id}] {approved_posts[i].title[:45]}",
             placeholder="편집할 게시글 선택",
             label_visibility="collapsed",
         )
@@ -472,17 +815,15 @@ def render() -> None:
         ):
             clear_llm_task(selected_post_id)
             clear_tts_task(selected_post_id)
-            threading.Thread(
-                target=delete_post,
-                args=(selected_post_id,),
-                daemon=True,
-            ).start()
+            _submit_bg(delete_post, selected_post_id)
             st.session_state["hidden_editor_ids"].add(selected_post_id)
             st.session_state["editor_idx"] = max(0, idx - 1)
             _safe_rerun_fragment()
     if new_idx != idx:
         st.session_state["editor_idx"] = new_idx
         _safe_rerun_fragment()
+    if _has_more:
+        st.caption(f"최근 {_EDITOR_PAGE_SIZE}건만 표시 중 — 편집 대기 게시글이 더 있습니다.")
 
     nav_prev, nav_info, nav_next = st.columns([1, 3, 1])
     with nav_prev:
@@ -499,28 +840,8 @@ def render() -> None:
             st.session_state["editor_idx"] = idx + 1
             _safe_rerun_fragment()
 
-    # ── 3. Content / ScriptData + 선택 게시글 댓글 로드 (단일 세션) ──────────────
-    from db.models import Comment
-    with SessionLocal() as _cs:
-        existing_content = (
-            _cs.query(Content)
-            .filter(Content.post_id == selected_post_id)
-            .first()
-        )
-        script_data: ScriptData | None = None
-        if existing_content and existing_content.summary_text:
-            try:
-                script_data = ScriptData.from_json(existing_content.summary_text)
-            except Exception:
-                pass
-        # 선택 게시글의 댓글만 로드 (기존: 30개 전체 selectinload → 1개만 쿼리)
-        _selected_comments = (
-            _cs.query(Comment)
-            .filter(Comment.post_id == selected_post_id)
-            .order_by(Comment.likes.desc())
-            .limit(5)
-            .all()
-        )
+    # 선택 게시글 베스트 댓글 5개 (rerun마다 재조회하지 않도록 60초 캐시)
+    _selected_comments = _cached_top_comments(selected_post_id, _comments_fp)
 
     cfg_editor = load_pipeline_config()
 
@@ -586,8 +907,8 @@ def render() -> None:
         if best_coms:
             st.markdown("**💬 베스트 댓글**")
             for c in best_coms:
-                lk = f" (+{c.likes})" if c.likes else ""
-                st.markdown(f"> {c.author}: {c.content[:100]}{lk}")
+                lk = f" (+{c['likes']})" if c["likes"] else ""
+                st.markdown(f"> {c['author']}: {c['content'][:100]}{lk}")
 
     # --- 오른쪽: AI 대본 편집 ---
     with col_edit:
@@ -597,9 +918,7 @@ def render() -> None:
         _llm_running = _llm_task is not None and _llm_task.get("status") == "running"
 
         with st.expander("⚙️ 재생성 파라미터", expanded=False):
-            _STYLE_PRESETS: dict[str, str] = {
-                p["name"]: p["prompt"] for p in load_style_presets()
-            }
+            _STYLE_PRESETS = load_style_preset_map()
             style_choice = st.selectbox(
                 "스타일 프리셋",
                 list(_STYLE_PRESETS.keys()),
@@ -615,6 +934,10 @@ def render() -> None:
                 (_STYLE_PRESETS[style_choice] + " " + extra_inst).strip() or None
             )
 
+        # 캐시된 헬스 상태를 미리 표시 (프로브 없음) — 클릭 전에 서버 다운을 알 수 있다
+        if not _llm_running and peek_ollama_health() is False:
+            st.caption("⚠️ 최근 확인 시 LLM 서버 응답 없음 — 설정 탭에서 Ollama 상태를 확인하세요.")
+
         # 버튼은 expander 밖: 항상 표시 (재생성 가능)
         if _llm_running:
             _gen_start = st.session_state.get(f"_llm_gen_requested_{_pid}")
@@ -640,7 +963,7 @@ def render() -> None:
             else:
                 best_list = _selected_comments[:5]
                 comment_texts = [
-                    f"{c.author}: {c.content[:100]}" for c in best_list
+                    f"{c['author']}: {c['content'][:100]}" for c in best_list
                 ]
                 submitted = submit_llm_task(
                     _pid,
@@ -660,37 +983,17 @@ def render() -> None:
         st.divider()
 
         # ── 편집 필드 ────────────────────────────────────────────────────────────
-        mood_options = ["funny", "serious", "shocking", "heartwarming"]
+        mood_options = _MOOD_OPTIONS
         _sd = script_data
 
-        # AI 생성 결과 주입 (이전 런 핸들러가 _ai_result_* 에 저장한 값)
-        _ai_pending = st.session_state.pop(f"_ai_result_{_pid}", None)
-        if _ai_pending is not None:
-            st.session_state[f"hook_{_pid}"]   = _ai_pending["hook"]
-            st.session_state[f"closer_{_pid}"] = _ai_pending["closer"]
-            st.session_state[f"title_{_pid}"]  = _ai_pending["title"]
-            st.session_state[f"tags_{_pid}"]   = _ai_pending["tags"]
-            _pm = _ai_pending["mood"]
-            st.session_state[f"mood_{_pid}"]   = _pm if _pm in mood_options else "funny"
-            st.session_state[f"body_scenes_{_pid}"] = _ai_pending["body_scenes"]
-            st.session_state[f"comment_scenes_{_pid}"] = _ai_pending["comment_scenes"]
-            st.session_state[f"comment_authors_{_pid}"] = _ai_pending["comment_authors"]
-            for _ok in list(st.session_state.keys()):
-                if _ok.startswith(f"bscene_{_pid}_") or _ok.startswith(f"cscene_{_pid}_"):
-                    del st.session_state[_ok]
-        else:
-            # 최초 방문: DB 값으로 초기화 (이후 방문은 기존 state 유지)
-            if f"hook_{_pid}" not in st.session_state:
-                st.session_state[f"hook_{_pid}"] = _sd.hook if _sd else ""
-            if f"closer_{_pid}" not in st.session_state:
-                st.session_state[f"closer_{_pid}"] = _sd.closer if _sd else ""
-            if f"title_{_pid}" not in st.session_state:
-                st.session_state[f"title_{_pid}"] = _sd.title_suggestion if _sd else ""
-            if f"tags_{_pid}" not in st.session_state:
-                st.session_state[f"tags_{_pid}"] = ", ".join(_sd.tags) if _sd else ""
-            if f"mood_{_pid}" not in st.session_state:
-                _m0 = (_sd.mood if _sd else "funny") or "funny"
-                st.session_state[f"mood_{_pid}"] = _m0 if _m0 in mood_options else "funny"
+        # 최초 방문: DB 값으로 초기화 (이후 방문·AI 결과 주입 후에는 기존 state 유지)
+        _ss = st.session_state
+        _ss.setdefault(f"hook_{_pid}", _sd.hook if _sd else "")
+        _ss.setdefault(f"closer_{_pid}", _sd.closer if _sd else "")
+        _ss.setdefault(f"title_{_pid}", _sd.title_suggestion if _sd else "")
+        _ss.setdefault(f"tags_{_pid}", ", ".join(_sd.tags) if _sd else "")
+        _m0 = (_sd.mood if _sd else "funny") or "funny"
+        _ss.setdefault(f"mood_{_pid}", _m0 if _m0 in _MOOD_SET else "funny")
 
         hook = st.text_area(
             "🎣 후킹 (Hook)",
@@ -700,30 +1003,11 @@ def render() -> None:
 
         _scene_editor_frag(_pid, _sd.body if _sd else [])
 
-        _body_scenes_v2: list[dict] = []
-        body_lines: list[str] = []
-        for _sc_txt in st.session_state.get(f"body_scenes_{_pid}", []):
-            _sc_lines = [l.strip() for l in _sc_txt.split("\n") if l.strip()]
-            if _sc_lines:
-                _body_scenes_v2.append({
-                    "type": "body", "line_count": len(_sc_lines), "lines": _sc_lines,
-                })
-                body_lines.append(" ".join(_sc_lines))
-
-        _comment_scenes_v2: list[dict] = []
-        comment_lines: list[str] = []
-        _c_authors = st.session_state.get(f"comment_authors_{_pid}", [])
-        for _ci, _sc_txt in enumerate(
-            st.session_state.get(f"comment_scenes_{_pid}", [])
-        ):
-            _sc_lines = [l.strip() for l in _sc_txt.split("\n") if l.strip()]
-            if _sc_lines:
-                _author = _c_authors[_ci] if _ci < len(_c_authors) else ""
-                _comment_scenes_v2.append({
-                    "type": "comment", "author": _author,
-                    "line_count": len(_sc_lines), "lines": _sc_lines,
-                })
-                comment_lines.append(" ".join(_sc_lines))
+        # 미리듣기/길이 표시는 씬별 한 줄 텍스트만 사용 — V2 dict는 저장/확정 시에만 생성
+        _body_scene_txts = tuple(st.session_state.get(f"body_scenes_{_pid}", []))
+        _comment_scene_txts = tuple(st.session_state.get(f"comment_scenes_{_pid}", []))
+        body_lines = _scene_lines(_body_scene_txts)
+        comment_lines = _scene_lines(_comment_scene_txts)
 
         closer = st.text_area(
             "🔚 마무리 (Closer)",
@@ -733,66 +1017,22 @@ def render() -> None:
 
         st.divider()
 
-        title_sug = st.text_input("🎬 영상 제목", key=f"title_{_pid}")
-        tags_input = st.text_input("🏷️ 태그 (쉼표 구분)", key=f"tags_{_pid}")
-        mood = st.selectbox("🎭 분위기", mood_options, key=f"mood_{_pid}")
-
-        bgm_name = _suggest_bgm(mood)
-        st.caption(f"🎵 선택 BGM: `{bgm_name}`")
-
-        st.divider()
-
-        # ── 예상 길이 + TTS 미리듣기 ─────────────────────────────────────────────
-        plain_preview = " ".join([hook] + body_lines + comment_lines + [closer])
-        char_count = len(plain_preview)
-        est_seconds = round(char_count / 5.5)
-        len_color = "green" if 35 <= est_seconds <= 60 else "orange"
-
-        info_c1, info_c2 = st.columns(2)
-        with info_c1:
-            st.markdown(
-                f"⏱️ 예상 길이: :{len_color}[{char_count}자 ≈ **{est_seconds}초**]"
-            )
-            if est_seconds < 35:
-                st.caption("⚠️ 너무 짧습니다 (권장 40~55초)")
-            elif est_seconds > 60:
-                st.caption("⚠️ 너무 깁니다 (권장 40~55초)")
-
-        _tts_running = _tts_task is not None and _tts_task.get("status") == "running"
-        _has_content = bool(plain_preview.strip())
-
-        with info_c2:
-            if _tts_running:
-                st.info("🎙️ TTS 생성 중...")
-                st.progress(0.0, text="TTS 처리 대기 중")
-            elif st.button(
-                "▶ TTS 미리듣기", width="stretch",
-                key=f"tts_preview_{selected_post_id}",
-                disabled=not _has_content,
-            ):
-                preview_path = MEDIA_DIR / "tmp" / f"preview_{selected_post_id}.mp3"
-                submitted = submit_tts_task(
-                    _pid,
-                    text=plain_preview,
-                    engine_name=cfg_editor["tts_engine"],
-                    voice=cfg_editor["tts_voice"],
-                    output_path=preview_path,
-                )
-                if submitted:
-                    _safe_rerun_fragment()
-                else:
-                    st.info("이미 생성 중입니다.")
-
-        audio_cache_key = f"tts_audio_{selected_post_id}"
-        if audio_cache_key in st.session_state:
-            st.audio(st.session_state[audio_cache_key])
+        # ── 예상 길이 + TTS 미리듣기 (fragment) ──────────────────────────────────
+        # 길이는 조각 길이 합으로 계산 — 합친 문자열은 TTS 제출 시에만 생성
+        _preview_parts = [hook, *body_lines, *comment_lines, closer]
+        _char_count = sum(map(len, _preview_parts)) + len(_preview_parts) - 1
+        est_seconds = round(_char_count / 5.5)  # 확정 검증용
+        _preview_tts_frag(_pid, _preview_parts, _char_count, cfg_editor)
 
         st.divider()
 
         # ── 저장 / 확정 ───────────────────────────────────────────────────────────
         def _build_script() -> ScriptData:
             _tags = [t.strip() for t in tags_input.split(",") if t.strip()]
-            _all_body = _body_scenes_v2 + _comment_scenes_v2
+            _all_body = _scene_items(_body_scene_txts) + _scene_items(
+                _comment_scene_txts,
+                tuple(st.session_state.get(f"comment_authors_{_pid}", [])),
+            )
             return ScriptData(
                 hook=hook,
                 body=_all_body,
@@ -804,10 +1044,12 @@ def render() -> None:
 
         def _persist_script(new_status: PostStatus | None = None) -> None:
             """ScriptData를 DB에 저장. new_status가 있으면 Post 상태도 직접 SQL로 변경."""
-            from datetime import datetime, timezone
-            from sqlalchemy import update as _sql_update
 
-            _built = _build_script()
+            _new_json = _build_script().to_json()
+            _hash_key = f"_saved_hash_{selected_post_id}"
+            _new_hash = _script_hash(_new_json)
+            if new_status is None and st.session_state.get(_hash_key) == _new_hash:
+                return  # DB 내용과 동일 — 쓰기 생략
             with SessionLocal() as _ws:
                 _cr = _ws.query(Content).filter(
                     Content.post_id == selected_post_id
@@ -815,7 +1057,7 @@ def render() -> None:
                 if _cr is None:
                     _cr = Content(post_id=selected_post_id)
                     _ws.add(_cr)
-                _cr.summary_text = _built.to_json()
+                _cr.summary_text = _new_json
                 _ws.flush()
                 if new_status is not None:
                     # 직접 SQL UPDATE — ai_worker 동시 수정 충돌(1020) 방지
@@ -828,6 +1070,7 @@ def render() -> None:
                         )
                     )
                 _ws.commit()
+            st.session_state[_hash_key] = _new_hash
 
         def _validate_editor() -> bool:
             if not hook.strip():
@@ -847,7 +1090,36 @@ def render() -> None:
                 return False
             return True
 
-        auto_c, save_c, confirm_c = st.columns(3)
+        # 메타 필드는 form으로 묶음 — 제목/태그/분위기 입력은 키 입력마다
+        # rerun하지 않고 💾 저장 시점에 한 번에 반영된다. Enter 제출은 끄고
+        # 상태를 바꾸는 전송/확정 버튼은 form 밖에 두어 오제출을 막는다
+        with st.form(f"meta_form_{_pid}", border=False, enter_to_submit=False):
+            title_sug = st.text_input("🎬 영상 제목", key=f"title_{_pid}")
+            tags_input = st.text_input("🏷️ 태그 (쉼표 구분)", key=f"tags_{_pid}")
+            mood = st.selectbox("🎭 분위기", mood_options, key=f"mood_{_pid}")
+
+            if st.form_submit_button(
+                "💾 저장", width="stretch",
+                key=f"draft_save_{selected_post_id}",
+                help="현재 편집 내용만 저장합니다 (상태 변경 없음, 편집실 유지)",
+            ):
+                if _validate_editor():
+                    try:
+                        _persist_script(new_status=None)
+                        st.toast("✅ 저장 완료")
+                    except Exception as exc:
+                        st.error(f"저장 실패: {exc}")
+
+        # form 밖 위젯은 마지막으로 제출된 제목/태그/분위기 값을 본다
+        bgm_name = _suggest_bgm(mood)
+        st.caption(
+            f"🎵 선택 BGM: `{bgm_name}` "
+            "(제목·태그·분위기 변경은 💾 저장 후 확정에 반영)"
+        )
+
+        st.divider()
+
+        auto_c, confirm_c = st.columns(2)
         with auto_c:
             if st.button(
                 "⏩ AI 워커 전송", width="stretch",
@@ -855,30 +1127,15 @@ def render() -> None:
                 help="편집 없이 AI 워커에 전송합니다 (APPROVED 상태로 전환)",
                 disabled=_llm_running,
             ):
-                _pid_auto = approved_posts[idx].id
+                # 이미 로드된 선택 게시글 id 재사용 (추가 세션·행 재조회 없음)
+                _pid_auto = selected_post_id
                 clear_llm_task(_pid_auto)
                 clear_tts_task(_pid_auto)
                 st.session_state["hidden_editor_ids"].add(_pid_auto)
-                threading.Thread(
-                    target=update_status,
-                    args=(_pid_auto, PostStatus.APPROVED),
-                    daemon=True,
-                ).start()
+                _submit_bg(update_status, _pid_auto, PostStatus.APPROVED)
                 st.toast("⏩ AI 워커 대기열로 전송됨")
                 st.session_state["editor_idx"] = max(0, idx - 1)
                 _safe_rerun_fragment()
-        with save_c:
-            if st.button(
-                "💾 저장", width="stretch",
-                key=f"draft_save_{selected_post_id}",
-                help="현재 편집 내용만 저장합니다 (상태 변경 없음, 편집실 유지)",
-            ):
-                if _validate_editor():
-                    try:
-                        _persist_script(new_status=None)
-                        st.toast("✅ 저장 완료")
-                    except Exception as exc:
-                        st.error(f"저장 실패: {exc}")
         with confirm_c:
             if st.button(
                 "✅ 확정 (저장+전송)", width="stretch", type="primary",
@@ -895,19 +1152,19 @@ def render() -> None:
                         st.error(f"확정 실패: {exc}")
 
     # ── 6. 비동기 작업 상태 모니터 (fragment — 2초마다 이 블록만 조용히 갱신) ────
-    @st.fragment(run_every="10s")
+    @st.fragment(run_every="2s")
     def _task_status_monitor(pid: int) -> None:
-        """LLM / TTS 작업 완료를 10초 간격으로 감지.
+        """LLM / TTS 작업 완료를 2초 간격으로 감지.
         완료 시점에만 전체 rerun을 트리거하고, 그 전까지는 이 fragment만 갱신.
+        실행 중인 작업이 있을 때만 렌더되므로 유휴 상태에서는 타이머가 없다.
         """
         _l = get_llm_task(pid)
         _t = get_tts_task(pid)
 
         if _l:
             if _l["status"] == "done":
-                _inject_ai_result(pid, _l["result"])
-                clear_llm_task(pid)
-                st.session_state.pop(f"_llm_gen_requested_{pid}", None)
+                # 결과 주입은 전체 rerun의 4단계(위젯 렌더 전)에서 처리 —
+                # 여기서는 이미 생성된 편집 위젯 키를 덮어쓸 수 없다
                 st.toast("✅ AI 대본 생성 완료!")
                 st.rerun()
             elif _l["status"] == "error":
@@ -940,4 +1197,9 @@ def render() -> None:
                 _msgs.append("🎙️ TTS")
             st.caption(f"{'·'.join(_msgs)} 생성 중... (자동 감지)")
 
-    _task_status_monitor(_pid)
+    # 4단계에서 읽은 상태 기준 — 실행 중일 때만 모니터 등록 (유휴 시 주기 rerun 없음)
+    if (
+        (_llm_task is not None and _llm_task.get("status") == "running")
+        or (_tts_task is not None and _tts_task.get("status") == "running")
+    ):
+        _task_status_monitor(_pid)
@@ -2,25 +2,66 @@
 
 import json
 import threading as _gal_threading
+import time as _gal_time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
-from sqlalchemy import func
+from sqlalchemy import func, tuple_
 
 from config.settings import MEDIA_DIR, load_pipeline_config
 from db.models import Post, PostStatus, Content, ScriptData
 from db.session import SessionLocal
+from uploaders.uploader import upload_post
 
 from dashboard.components.status_utils import (
-    stats_display, delete_post, STATUS_COLORS, STATUS_EMOJI, STATUS_TEXT,
+    stats_display, delete_post, status_meta,
 )
 from dashboard.workers.hd_render import (
-    hd_render_pending, hd_render_errors, enqueue_hd_render,
+    hd_render_pending, hd_render_errors, enqueue_hd_render, hd_render_done_seq,
 )
 
-# 플랫폼별 업로드 작업 레지스트리: "{post_id}_{platform}" → {"status": ..., "error": ...}
-_upload_tasks: dict[str, dict] = {}
+# 플랫폼별 업로드 작업 레지스트리: "{post_id}_{platform}" → {"status": ..., "error": ..., "ts": ...}
+# 삽입 순서 = 갱신 순서 (OrderedDict) — 상한 초과·TTL 경과 시 오래된 완료 항목부터 정리
+_upload_tasks: "OrderedDict[str, dict]" = OrderedDict()
 _upload_lock = _gal_threading.Lock()
+_UPLOAD_TASKS_MAX = 256
+_UPLOAD_TASK_TTL = 3600  # 완료(done/error) 항목 보존 시간 (초)
+# 업로드 완료(성공/실패) 누적 횟수 — 작업 모니터가 변화 감지용으로 비교
+_upload_done_seq = 0
+
+
+def _set_upload_task(task_key: str, task: dict) -> None:
+    """업로드 작업 상태 기록 (_upload_lock 보유 상태에서 호출).
+
+    카드가 화면에 없어 pop되지 않은 완료 항목이 쌓이지 않도록 기록 시마다
+    TTL 경과·상한 초과 완료 항목을 정리한다. running 항목은 제거하지 않는다.
+    """
+    _now = _gal_time.monotonic()
+    task["ts"] = _now
+    _upload_tasks[task_key] = task
+    _upload_tasks.move_to_end(task_key)
+    _excess = len(_upload_tasks) - _UPLOAD_TASKS_MAX
+    for _k in list(_upload_tasks):
+        _t = _upload_tasks[_k]
+        if _t.get("status") == "running":
+            continue
+        if _excess > 0 or _now - _t.get("ts", _now) > _UPLOAD_TASK_TTL:
+            del _upload_tasks[_k]
+            _excess -= 1
+        else:
+            break  # 이후 항목은 더 최근 — 정리 대상 없음
+
+
+def _mark_upload_finished(task_key: str, task: dict) -> None:
+    """업로드 작업 결과 기록 + 완료 카운터 증가 (작업 스레드에서 호출)."""
+    global _upload_done_seq
+    with _upload_lock:
+        _set_upload_task(task_key, task)
+        _upload_done_seq += 1
+
 
 # 플랫폼별 표시 정보 (label, help)
 _PLATFORM_DISPLAY: dict[str, tuple[str, str]] = {
@@ -36,23 +77,108 @@ def _get_upload_platforms() -> tuple[str, ...]:
     return tuple(json.loads(cfg.get("upload_platforms", '["youtube"]')))
 
 
+_EXISTS_TTL = 10  # 파일 존재 여부 캐시 유효 시간 (초)
+
+
+@lru_cache(maxsize=1024)
+def _exists_cached(path_str: str, epoch: int) -> bool:
+    """(경로, 10초 구간) 단위 stat 캐시 — epoch이 바뀌면 새 키로 재확인."""
+    return Path(path_str).exists()
+
+
+def _path_exists(path: Path) -> bool:
+    """썸네일/영상 파일 존재 여부 (최대 10초 지연 반영, rerun마다 stat 반복 방지)."""
+    return _exists_cached(str(path), int(_gal_time.time() // _EXISTS_TTL))
+
+
+def _script_preview(summary_text: str | None) -> dict | None:
+    """대본 expander용 {hook, body, closer} — 파싱 실패(레거시 평문)·빈 값이면 None."""
+    if not summary_text:
+        return None
+    try:
+        script = ScriptData.from_json(summary_text)
+    except Exception:
+        return None
+    return {"hook": script.hook, "body": script.body, "closer": script.closer}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_gallery_page(
+    statuses: tuple[str, ...],
+    cursor: "tuple[datetime, int] | None",
+    page_size: int,
+    sentinel: tuple,
+) -> tuple[list[dict], bool]:
+    """갤러리 한 페이지 카드 데이터 + 다음 페이지 존재 여부 (30초 캐시).
+
+    키셋 페이지네이션 — cursor(이전 페이지 마지막 카드의 created_at, content_id)보다
+    오래된 행부터 page_size건 (OFFSET 스캔 없음, ix_contents_created_id 사용).
+    sentinel(최신 updated_at·건수·완료 카운터)이 바뀌면 캐시 키가 달라져 재조회된다.
+    캐시 직렬화를 위해 ORM 객체 대신 plain dict로 반환한다.
+    """
+    with SessionLocal() as session:
+        # 카드에 필요한 컬럼만 조회 — ORM 엔티티 생성·identity map 등록 생략
+        _q = (
+            session.query(
+                Content.id, Content.post_id, Content.video_path, Content.upload_meta,
+                Content.summary_text, Content.created_at,
+                Post.title, Post.status, Post.stats,
+            )
+            .join(Post)
+            .filter(Post.status.in_([PostStatus(s) for s in statuses]))
+        )
+        if cursor is not None:
+            _q = _q.filter(tuple_(Content.created_at, Content.id) < cursor)
+        rows = (
+            _q.order_by(Content.created_at.desc(), Content.id.desc())
+            .limit(page_size + 1)  # 1건 더 조회해 다음 페이지 여부 판별
+            .all()
+        )
+    _has_next = len(rows) > page_size
+    cards = [
+        {
+            "post_id": r.post_id,
+            "content_id": r.id,
+            "title": r.title,
+            "status": r.status,
+            "stats": r.stats,
+            "video_path": r.video_path,
+            "upload_meta": _parse_upload_meta(r.upload_meta),
+            "summary_text": r.summary_text,
+            "script": _script_preview(r.summary_text),
+            "created_at": r.created_at,
+        }
+        for r in rows[:page_size]
+    ]
+    return cards, _has_next
+
+
+def _reset_gallery_cursor() -> None:
+    """필터 변경 시 첫 페이지로 (키셋 커서·이전 페이지 스택 초기화)."""
+    st.session_state["gallery_cursor"] = None
+    st.session_state["gallery_cursor_stack"] = []
+
+
 # ---------------------------------------------------------------------------
 # 갤러리 액션 버튼 fragment
 # ---------------------------------------------------------------------------
 
-@st.fragment
-def _gallery_action_btn(post_id: int, content_id: int) -> None:
-    """갤러리 btn_col1 fragment — HD 렌더/플랫폼별 업로드 버튼."""
-    with SessionLocal() as _s:
-        _post = _s.get(Post, post_id)
-        _content = _s.query(Content).filter_by(post_id=post_id).first()
-        if _post is None:
-            return
-        _upload_meta: dict = {}
-        if _content and _content.upload_meta:
-            _raw = _content.upload_meta
-            _upload_meta = json.loads(_raw) if isinstance(_raw, str) else (_raw or {})
+def _parse_upload_meta(raw: "dict | str | None") -> dict:
+    """Content.upload_meta → dict (레거시 문자열 JSON 호환)."""
+    if not raw:
+        return {}
+    return json.loads(raw) if isinstance(raw, str) else raw
+
 
+@st.fragment
+def _gallery_action_btn(
+    post_id: int, content_id: int, status: PostStatus, upload_meta: dict,
+) -> None:
+    """갤러리 btn_col1 fragment — HD 렌더/플랫폼별 업로드 버튼.
+
+    status/upload_meta는 render() 시점 스냅샷 — fragment 재실행마다 DB를 조회하지 않는다.
+    세션은 업로드 버튼 클릭 시 작업 스레드에서만 연다.
+    """
     _hd_err = hd_render_errors.pop(post_id, None)
     if _hd_err:
         st.error(f"렌더링 실패: {_hd_err}")
@@ -65,7 +191,7 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
             disabled=True,
             help="고화질 렌더링이 대기 중이거나 진행 중입니다.",
         )
-    elif _post.status in (PostStatus.RENDERED, PostStatus.UPLOADED):
+    elif status in (PostStatus.RENDERED, PostStatus.UPLOADED):
         # ── 플랫폼별 업로드 버튼 ──
         platforms = _get_upload_platforms()
         _cols = st.columns(len(platforms)) if len(platforms) > 1 else [st.container()]
@@ -78,9 +204,9 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
                     _plat, (f"📤 {_plat}", f"{_plat}에 업로드"),
                 )
                 _already = (
-                    _plat in _upload_meta
-                    and isinstance(_upload_meta[_plat], dict)
-                    and not _upload_meta[_plat].get("error")
+                    _plat in upload_meta
+                    and isinstance(upload_meta[_plat], dict)
+                    and not upload_meta[_plat].get("error")
                 )
 
                 if _task and _task["status"] == "running":
@@ -119,8 +245,6 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
                         def _do_upload(pid: int, plat: str) -> None:
                             _tk = f"{pid}_{plat}"
                             try:
-                                from uploaders.uploader import upload_post
-
                                 with SessionLocal() as _us:
                                     _up = _us.get(Post, pid)
                                     _uc = _us.query(Content).filter_by(post_id=pid).first()
@@ -129,8 +253,7 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
                                         if _up.status == PostStatus.RENDERED:
                                             _up.status = PostStatus.UPLOADED
                                         _us.commit()
-                                        with _upload_lock:
-                                            _upload_tasks[_tk] = {"status": "done"}
+                                        _mark_upload_finished(_tk, {"status": "done"})
                                     else:
                                         _us.refresh(_uc)
                                         _pm = (_uc.upload_meta or {}).get(plat, {})
@@ -139,27 +262,25 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
                                             if isinstance(_pm, dict)
                                             else "업로드 실패"
                                         )
-                                        with _upload_lock:
-                                            _upload_tasks[_tk] = {
-                                                "status": "error",
-                                                "error": _err,
-                                            }
+                                        _mark_upload_finished(
+                                            _tk, {"status": "error", "error": _err},
+                                        )
                             except Exception as _e:
-                                with _upload_lock:
-                                    _upload_tasks[f"{pid}_{plat}"] = {
-                                        "status": "error",
-                                        "error": str(_e),
-                                    }
+                                _mark_upload_finished(
+                                    _tk, {"status": "error", "error": str(_e)},
+                                )
 
                         with _upload_lock:
-                            _upload_tasks[_task_key] = {"status": "running"}
+                            _set_upload_task(_task_key, {"status": "running"})
                         _gal_threading.Thread(
                             target=_do_upload,
                             args=(post_id, _target),
                             daemon=True,
                         ).start()
+                        # 전체 rerun — 진행 중 작업이 생겼으므로 작업 모니터 fragment 등록
+                        st.rerun()
 
-    elif _post.status == PostStatus.PREVIEW_RENDERED:
+    elif status == PostStatus.PREVIEW_RENDERED:
         if st.button(
             "🎬 고화질",
             key=f"hd_{content_id}",
@@ -167,6 +288,25 @@ def _gallery_action_btn(post_id: int, content_id: int) -> None:
             help="1080×1920 고화질로 재렌더링",
         ):
             enqueue_hd_render(post_id)
+            st.rerun()  # 작업 모니터 fragment 등록
+
+
+@st.fragment
+def _video_player(content_id: int, video_path: str) -> None:
+    """영상 플레이어 — 재생 버튼을 누른 카드만 st.video 등록.
+
+    expander 안의 st.video는 접혀 있어도 매 rerun마다 실행되어 영상 파일을
+    미디어 파일 매니저에 적재한다. 버튼 상태는 이 fragment만 재실행한다.
+    """
+    _open: set[int] = st.session_state.setdefault("gallery_video_open", set())
+    if content_id in _open:
+        st.video(video_path)
+        if st.button("⏹ 닫기", key=f"vid_close_{content_id}", width="stretch"):
+            _open.discard(content_id)
+            st.rerun(scope="fragment")
+    elif st.button("▶️ 영상 재생", key=f"vid_open_{content_id}", width="stretch"):
+        _open.add(content_id)
+        st.rerun(scope="fragment")
 
 
 # ---------------------------------------------------------------------------
@@ -184,22 +324,22 @@ def render() -> None:
         if st.button("🔄 새로고침", key="gallery_refresh_btn", width="stretch"):
             st.rerun()
 
-    # HD 렌더 또는 업로드 진행 중일 때 자동 감지 fragment
-    @st.fragment(run_every="10s")
-    def _gallery_task_monitor() -> None:
-        """HD 렌더/업로드 완료 시 자동 새로고침."""
-        _has_pending = bool(hd_render_pending) or any(
-            t.get("status") == "running" for t in _upload_tasks.values()
-        )
-        _has_done = bool(hd_render_errors) or any(
-            t.get("status") in ("done", "error") for t in _upload_tasks.values()
-        )
-        if _has_done:
+    # HD 렌더 또는 업로드 진행 중일 때만 자동 감지 fragment 등록 — 유휴 시 주기 rerun 없음
+    @st.fragment(run_every="3s")
+    def _gallery_task_monitor(seen: tuple[int, int]) -> None:
+        """HD 렌더/업로드 완료 시 자동 새로고침.
+
+        seen은 등록 시점의 (HD 렌더, 업로드) 완료 카운터 — 값이 바뀌면 전체 갱신.
+        카운터 비교라 여러 탭/세션이 동시에 보고 있어도 각자 완료를 놓치지 않는다.
+        """
+        if (hd_render_done_seq(), _upload_done_seq) != seen:
             st.rerun()  # 완료 감지 → 전체 갱신
-        elif _has_pending:
-            st.caption("⏳ 렌더링/업로드 작업 진행 중... (자동 감지)")
+        st.caption("⏳ 렌더링/업로드 작업 진행 중... (자동 감지)")
 
-    _gallery_task_monitor()
+    with _upload_lock:  # 작업 스레드가 정리 중일 수 있으므로 잠금 후 순회
+        _uploading = any(t.get("status") == "running" for t in _upload_tasks.values())
+    if hd_render_pending or _uploading:
+        _gallery_task_monitor((hd_render_done_seq(), _upload_done_seq))
 
     # HD 렌더 진행 상태 표시
     if hd_render_pending:
@@ -215,6 +355,7 @@ def render() -> None:
         default=["PREVIEW_RENDERED", "RENDERED", "UPLOADED"],
         key="gallery_status_filter",
         placeholder="상태 선택 (기본: 전체)",
+        on_change=_reset_gallery_cursor,
     )
     _gal_statuses = (
         [PostStatus(s) for s in _gal_filter]
@@ -222,118 +363,124 @@ def render() -> None:
         else [PostStatus.PREVIEW_RENDERED, PostStatus.RENDERED, PostStatus.UPLOADED]
     )
 
-    if "gallery_page" not in st.session_state:
-        st.session_state["gallery_page"] = 0
+    # 키셋 커서 (None = 첫 페이지) + ◀ 이동용 이전 커서 스택
+    st.session_state.setdefault("gallery_cursor", None)
+    _cursor_stack: list = st.session_state.setdefault("gallery_cursor_stack", [])
 
     _GAL_PAGE_SIZE = 12  # 3열 × 4행
 
+    # 변경 감지용 센티널 (집계 1회) — 값이 같으면 페이지 목록은 캐시에서 제공
+    # 대시보드에서 끝난 업로드/HD 렌더는 완료 카운터로도 즉시 무효화
     with SessionLocal() as session:
-        _total_gal = (
-            session.query(func.count(Content.id))
+        _max_updated, _total_gal = (
+            session.query(func.max(Post.updated_at), func.count(Content.id))
+            .select_from(Content)
             .join(Post)
             .filter(Post.status.in_(_gal_statuses))
-            .scalar() or 0
-        )
-        contents = (
-            session.query(Content)
-            .join(Post)
-            .filter(Post.status.in_(_gal_statuses))
-            .order_by(Content.created_at.desc())
-            .offset(st.session_state["gallery_page"] * _GAL_PAGE_SIZE)
-            .limit(_GAL_PAGE_SIZE)
-            .all()
+            .one()
         )
+    _total_gal = _total_gal or 0
+    _sentinel = (_max_updated, _total_gal, hd_render_done_seq(), _upload_done_seq)
+    cards, _has_next = _fetch_gallery_page(
+        tuple(s.value for s in _gal_statuses),
+        st.session_state["gallery_cursor"],
+        _GAL_PAGE_SIZE,
+        _sentinel,
+    )
 
-        if not contents:
-            st.info("🎥 아직 렌더링된 영상이 없습니다.")
-        else:
-            st.caption(f"총 {_total_gal}개의 영상")
-
-            # 3열 그리드 레이아웃
-            cols = st.columns(3)
-
-            for idx, content in enumerate(contents):
-                with cols[idx % 3]:
-                    post = content.post
-
-                    # 영상 파일 확인
-                    video_path = MEDIA_DIR / content.video_path if content.video_path else None
-
-                    # 컨테이너
-                    with st.container(border=True):
-                        # 상태 배지 (색상 + 이모지 + 텍스트)
-                        color = STATUS_COLORS[post.status]
-                        emoji = STATUS_EMOJI[post.status]
-                        text = STATUS_TEXT.get(post.status, post.status.value)
-                        st.markdown(f":{color}[{emoji} {post.status.value} — {text}]")
-
-                        # 제목
-                        st.markdown(f"**{post.title[:40]}**")
-
-                        # 통계
-                        views, likes, _ = stats_display(post.stats)
-                        st.caption(f"👁️ {views:,} | 👍 {likes:,}")
-
-                        # 썸네일
-                        thumb_path_str = (content.upload_meta or {}).get("thumbnail_path")
-                        if thumb_path_str:
-                            thumb_path = Path(thumb_path_str)
-                            if thumb_path.exists():
-                                st.image(str(thumb_path), width="stretch")
-
-                        # 영상 플레이어 (주문형 로드 — 초기 미디어 요청 최소화)
-                        if video_path and video_path.exists():
-                            with st.expander("▶️ 영상 재생"):
-                                st.video(str(video_path))
-                        else:
-                            st.caption("영상 파일 없음")
-
-                        # 요약 텍스트
-                        if content.summary_text:
-                            with st.expander("📝 대본"):
-                                try:
-                                    script = ScriptData.from_json(content.summary_text)
-                                    st.write(f"**후킹:** {script.hook}")
-                                    for line in script.body:
-                                        st.write(f"- {line}")
-                                    st.write(f"**마무리:** {script.closer}")
-                                except Exception:
-                                    st.write(content.summary_text)
-
-                        # 액션 버튼
-                        btn_col1, btn_col2 = st.columns(2)
-
-                        with btn_col1:
-                            if post.status in (
-                                PostStatus.PREVIEW_RENDERED,
-                                PostStatus.RENDERED,
-                                PostStatus.UPLOADED,
-                            ) or post.id in hd_render_pending:
-                                _gallery_action_btn(post.id, content.id)
-
-                        with btn_col2:
-                            if st.button(
-                                "🗑️ 삭제",
-                                key=f"confirm_del_{content.id}",
-                                use_container_width=True,
-                            ):
-                                delete_post(post.id)
-                                st.toast("🗑️ 삭제됨")
-                                st.rerun()
+    if not cards:
+        st.info("🎥 아직 렌더링된 영상이 없습니다.")
+    else:
+        st.caption(f"총 {_total_gal}개의 영상")
+
+        # 3열 그리드 레이아웃
+        cols = st.columns(3)
+
+        for idx, card in enumerate(cards):
+            with cols[idx % 3]:
+                _status: PostStatus = card["status"]
+                _upload_meta: dict = card["upload_meta"]
+
+                # 영상 파일 확인
+                video_path = MEDIA_DIR / card["video_path"] if card["video_path"] else None
+
+                # 컨테이너
+                with st.container(border=True):
+                    # 상태 배지 (색상 + 이모지 + 텍스트)
+                    color, emoji, text = status_meta(_status)
+                    st.markdown(f":{color}[{emoji} {_status.value} — {text}]")
+
+                    # 제목
+                    st.markdown(f"**{card['title'][:40]}**")
+
+                    # 통계
+                    views, likes, _ = stats_display(card["stats"])
+                    st.caption(f"👁️ {views:,} | 👍 {likes:,}")
+
+                    # 썸네일
+                    thumb_path_str = _upload_meta.get("thumbnail_path")
+                    if thumb_path_str:
+                        thumb_path = Path(thumb_path_str)
+                        if _path_exists(thumb_path):
+                            st.image(str(thumb_path), width="stretch")
+
+                    # 영상 플레이어 (주문형 로드 — 재생 요청한 카드만 미디어 등록)
+                    if video_path and _path_exists(video_path):
+                        _video_player(card["content_id"], str(video_path))
+                    else:
+                        st.caption("영상 파일 없음")
+
+                    # 요약 텍스트
+                    if card["summary_text"]:
+                        with st.expander("📝 대본"):
+                            # 파싱은 페이지 조회 시 1회 (캐시) — rerun마다 JSON 디코드하지 않음
+                            script = card["script"]
+                            if script is not None:
+                                st.write(f"**후킹:** {script['hook']}")
+                                for line in script["body"]:
+                                    st.write(f"- {line}")
+                                st.write(f"**마무리:** {script['closer']}")
+                            else:
+                                st.write(card["summary_text"])
+
+                    # 액션 버튼
+                    btn_col1, btn_col2 = st.columns(2)
+
+                    with btn_col1:
+                        if _status in (
+                            PostStatus.PREVIEW_RENDERED,
+                            PostStatus.RENDERED,
+                            PostStatus.UPLOADED,
+                        ) or card["post_id"] in hd_render_pending:
+                            _gallery_action_btn(
+                                card["post_id"], card["content_id"], _status, _upload_meta,
+                            )
+
+                    with btn_col2:
+                        if st.button(
+                            "🗑️ 삭제",
+                            key=f"confirm_del_{card['content_id']}",
+                            use_container_width=True,
+                        ):
+                            delete_post(card["post_id"])
+                            st.toast("🗑️ 삭제됨")
+                            st.rerun()
 
     # 페이지네이션 버튼 (12건 초과 시)
     if _total_gal > _GAL_PAGE_SIZE:
         _gp1, _gp2, _gp3 = st.columns([1, 3, 1])
         with _gp1:
-            if st.button("◀", disabled=st.session_state["gallery_page"] == 0, key="gal_prev"):
-                st.session_state["gallery_page"] -= 1
+            if st.button("◀", disabled=not _cursor_stack, key="gal_prev"):
+                st.session_state["gallery_cursor"] = _cursor_stack.pop()
                 st.rerun()
         with _gp2:
-            _cur_page = st.session_state["gallery_page"]
+            _cur_page = len(_cursor_stack)
             _total_pages = (_total_gal + _GAL_PAGE_SIZE - 1) // _GAL_PAGE_SIZE
             st.caption(f"페이지 {_cur_page + 1} / {_total_pages} (전체 {_total_gal}건)")
         with _gp3:
-            _has_next = (_cur_page + 1) * _GAL_PAGE_SIZE < _total_gal
-            if st.button("▶", disabled=not _has_next, key="gal_next"):
-                st.session_state["gallery_page"] += 1
+            if st.button("▶", disabled=not (_has_next and cards), key="gal_next"):
+                _cursor_stack.append(st.session_state["gallery_cursor"])
+                st.session_state["gallery_cursor"] = (
+                    cards[-1]["created_at"], cards[-1]["content_id"],
+                )
                 st.rerun()
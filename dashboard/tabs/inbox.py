@@ -13,6 +13,7 @@ from db.session import SessionLocal
 
 from dashboard.components.status_utils import (
     to_kst, stats_display, update_status, check_ollama_health, batch_update_status,
+    top_comments_bulk,
 )
 from dashboard.components.image_slider import render_image_slider
 from dashboard.workers.ai_analysis_tasks import (
@@ -235,8 +236,6 @@ def render() -> None:
     # ---------------------------------------------------------------------------
     # 데이터 조회 (N+1 방지: 댓글 일괄 사전 로드)
     # ---------------------------------------------------------------------------
-    from db.models import Comment
-
     with SessionLocal() as session:
         # 기본 필터 구성
         base_filter = [Post.status == PostStatus.COLLECTED]
@@ -287,18 +286,8 @@ def render() -> None:
 
         posts = query.limit(_INBOX_PAGE_SIZE).offset(_page * _INBOX_PAGE_SIZE).all()
 
-        # 댓글 일괄 사전 로드 (N+1 → 1+1 쿼리)
-        _all_comments: dict[int, list] = {}
-        _post_ids = [p.id for p in posts]
-        if _post_ids:
-            _comments_raw = (
-                session.query(Comment)
-                .filter(Comment.post_id.in_(_post_ids))
-                .order_by(Comment.likes.desc())
-                .all()
-            )
-            for _c in _comments_raw:
-                _all_comments.setdefault(_c.post_id, []).append(_c)
+        # 베스트 댓글 일괄 사전 로드 (N+1 → 1+1 쿼리, 게시글당 상위 2개만)
+        _all_comments = top_comments_bulk([p.id for p in posts], session, limit=2)
 
         # 3단계 티어 분류
         high_posts   = [p for p in posts if (p.engagement_score or 0) >= 80]
@@ -12,7 +12,7 @@ from db.session import SessionLocal
 
 from dashboard.components.status_utils import (
     to_kst, stats_display, update_status, delete_post,
-    STATUS_COLORS, STATUS_EMOJI, STATUS_TEXT,
+    STATUS_EMOJI, status_meta,
 )
 
 
@@ -144,9 +144,7 @@ def render() -> None:
         with SessionLocal() as session:
             for status in progress_statuses:
                 count = _counts.get(status, 0)
-                color = STATUS_COLORS[status]
-                emoji = STATUS_EMOJI[status]
-                text = STATUS_TEXT.get(status, status.value)
+                color, emoji, text = status_meta(status)
                 label = f":{color}[{emoji} {status.value} — {text}] ({count}건)"
 
                 with st.expander(label, expanded=False):
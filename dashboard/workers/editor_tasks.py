@@ -7,6 +7,7 @@ hd_render.py와 동일한 패턴:
 import logging
 import time as _time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -26,6 +27,9 @@ _TASK_TTL_SECONDS = 300
 # 실행 중 태스크 타임아웃 (초) — 30분 초과 시 error 전환
 _TASK_TIMEOUT_SECONDS = 1800
 
+# TTS 미리듣기 전용 풀 — 요청마다 스레드 생성 대신 재사용, 동시 합성 수 제한
+_tts_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-prev")
+
 
 def _auto_save_to_db(post_id: int, script: "ScriptData") -> None:
     """LLM 완료 결과를 Content.summary_text에 즉시 저장."""
@@ -176,7 +180,7 @@ def submit_tts_task(
     voice: str,
     output_path: Path,
 ) -> bool:
-    """TTS 미리듣기 생성 작업을 백그라운드 스레드로 제출.
+    """TTS 미리듣기 생성 작업을 TTS 전용 스레드 풀에 제출.
 
     Returns:
         True  — 신규 제출 성공
@@ -203,7 +207,7 @@ def submit_tts_task(
             log.exception("TTS 미리듣기 실패: post_id=%d", post_id)
             _tts_tasks[post_id] = {"status": "error", "error": str(exc)}
 
-    threading.Thread(target=_run, daemon=True, name=f"tts-prev-{post_id}").start()
+    _tts_pool.submit(_run)
     return True
 
 
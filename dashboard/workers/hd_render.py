@@ -21,6 +21,13 @@ hd_render_errors: dict[int, str] = {}
 _hd_render_queue: _queue.Queue[int] = _queue.Queue()
 _hd_worker_lock = threading.Lock()
 _hd_worker_started = False
+# 완료(성공/실패) 누적 횟수 — UI 모니터가 이전 값과 비교해 변화 시에만 rerun
+_hd_done_seq = 0
+
+
+def hd_render_done_seq() -> int:
+    """HD 렌더 완료 누적 횟수 (세션별로 마지막으로 본 값과 비교용)."""
+    return _hd_done_seq
 
 
 def _run_hd_render(post_id: int) -> None:
@@ -29,6 +36,7 @@ def _run_hd_render(post_id: int) -> None:
     SD 렌더링과 동일한 layout_renderer 파이프라인을 사용하되
     출력 파일명을 _FHD.mp4로 지정한다. GPU(_resolve_codec) 자동 선택.
     """
+    global _hd_done_seq
     try:
         from ai_worker.renderer.layout import render_layout_video_from_scenes
         from ai_worker.scene.analyzer import analyze_resources
@@ -87,6 +95,8 @@ def _run_hd_render(post_id: int) -> None:
         hd_render_errors[post_id] = str(_e)
     finally:
         hd_render_pending.discard(post_id)
+        with _hd_worker_lock:
+            _hd_done_seq += 1
 
 
 def _hd_render_worker() -> None:
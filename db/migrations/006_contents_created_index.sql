@@ -0,0 +1,3 @@
+-- 006: contents (created_at, id) 복합 인덱스
+-- 갤러리 키셋 페이지네이션 (created_at, id) < cursor ORDER BY created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS ix_contents_created_id ON contents (created_at, id);
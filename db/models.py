@@ -9,6 +9,11 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import declarative_base, relationship
 
+try:
+    import orjson as _orjson
+except ImportError:  # 선택 의존성 — 없으면 표준 json 사용
+    _orjson = None
+
 Base = declarative_base()
 
 
@@ -90,6 +95,10 @@ class Comment(Base):
 
 class Content(Base):
     __tablename__ = "contents"
+    __table_args__ = (
+        # 갤러리 키셋 페이지네이션: ORDER BY created_at DESC, id DESC
+        Index("ix_contents_created_id", "created_at", "id"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     post_id = Column(
@@ -230,21 +239,23 @@ class ScriptData:
         return " ".join(texts)
 
     def to_json(self) -> str:
-        return _json.dumps(
-            {
-                "hook": self.hook,
-                "body": self.body,
-                "closer": self.closer,
-                "title_suggestion": self.title_suggestion,
-                "tags": self.tags,
-                "mood": self.mood,
-            },
-            ensure_ascii=False,
-        )
+        payload = {
+            "hook": self.hook,
+            "body": self.body,
+            "closer": self.closer,
+            "title_suggestion": self.title_suggestion,
+            "tags": self.tags,
+            "mood": self.mood,
+        }
+        if _orjson is not None:
+            # orjson은 UTF-8 원문 그대로 출력 (ensure_ascii=False와 동일)
+            return _orjson.dumps(payload).decode("utf-8")
+        return _json.dumps(payload, ensure_ascii=False)
 
     @classmethod
     def from_json(cls, raw: str) -> "ScriptData":
-        d = _json.loads(raw)
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스 — 기존 except 유지
+        d = _orjson.loads(raw) if _orjson is not None else _json.loads(raw)
         body_raw = d.get("body", [])
         # 하위 호환: 기존 str 항목 → dict 변환
         body: list[dict] = []
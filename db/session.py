@@ -1,5 +1,5 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from config.settings import DATABASE_URL
 from db.models import Base
@@ -23,6 +23,10 @@ SessionLocal = sessionmaker(
                               # detached 상태에서 selectinload된 관계 접근 시 LazyLoad 오류 제거
 )
 
+# 스레드 로컬 세션 — 대시보드 상태 변경 헬퍼처럼 버튼 클릭마다 반복 호출되는 경로용.
+# 사용 후 반드시 ScopedSession.remove()로 커넥션을 풀에 반환할 것.
+ScopedSession = scoped_session(SessionLocal)
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
@@ -8,6 +8,7 @@ import logging
 import re
 import sys
 import time
+from unittest.mock import MagicMock
 from urllib.parse import urlparse
 
 import requests
@@ -262,6 +263,93 @@ def fetch_image_like_dashboard(sess: requests.Session, url: str) -> dict:
         return {"ok": False, "status": 0, "size": 0, "content_type": "", "error": str(e)}
 
 
+# =====================================================================
+# 단위 테스트: 슬라이더 본문 스트리밍 (Mock 기반, 네트워크 불필요)
+#   python -m pytest test/test_dc_images.py -v
+# =====================================================================
+
+def _fake_response(chunks: list[bytes], content_length: str | None = None) -> MagicMock:
+    """iter_content가 주어진 청크를 순서대로 내보내는 가짜 Response."""
+    resp = MagicMock()
+    resp.headers = {"Content-Length": content_length} if content_length else {}
+    resp.iter_content.return_value = iter(chunks)
+    return resp
+
+
+class TestSliderReadBody:
+    """image_slider._looks_like_image / _read_body 검증."""
+
+    def test_looks_like_image_accepts_known_formats(self):
+        """JPEG·PNG·GIF·WEBP·AVIF·HEIC 선두 바이트를 이미지로 판별한다."""
+        from dashboard.components.image_slider import _looks_like_image
+
+        assert _looks_like_image(b"\xff\xd8\xff\xe0" + b"\x00" * 8)
+        assert _looks_like_image(b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0d")
+        assert _looks_like_image(b"GIF89a\x01\x00\x01\x00\x00\x00")
+        assert _looks_like_image(b"RIFF\x00\x10\x00\x00WEBP")
+        assert _looks_like_image(b"\x00\x00\x00\x1cftypavif")
+        assert _looks_like_image(b"\x00\x00\x00\x18ftypheic")
+
+    def test_looks_like_image_rejects_video_and_html(self):
+        """MP4/MOV(ftyp 동영상 브랜드)와 HTML 차단 페이지는 거부한다."""
+        from dashboard.components.image_slider import _looks_like_image
+
+        assert not _looks_like_image(b"\x00\x00\x00\x20ftypisom")
+        assert not _looks_like_image(b"\x00\x00\x00\x18ftypmp42")
+        assert not _looks_like_image(b"\x00\x00\x00\x14ftypqt  ")
+        assert not _looks_like_image(b"<!DOCTYPE html>")
+
+    def test_read_body_joins_chunks(self):
+        """정상 이미지는 모든 청크를 이어 붙여 반환한다."""
+        from dashboard.components.image_slider import _read_body
+
+        chunks = [b"\xff\xd8\xff\xe0" + b"a" * 100, b"b" * 100, b"c" * 10]
+        resp = _fake_response(chunks, content_length="214")
+
+        assert _read_body(resp, "https://example.com/a.jpg") == b"".join(chunks)
+
+    def test_read_body_rejects_non_image_first_chunk(self):
+        """첫 청크 매직 바이트가 이미지가 아니면 나머지를 읽지 않고 중단한다."""
+        from dashboard.components.image_slider import _read_body
+
+        rest = MagicMock()
+        resp = _fake_response([b"<html>blocked</html>", rest])
+
+        assert _read_body(resp, "https://example.com/a.jpg") is None
+        # 두 번째 청크까지 진행하지 않음 (iterator에 남아 있음)
+        assert next(resp.iter_content.return_value) is rest
+
+    def test_read_body_rejects_declared_oversize(self):
+        """Content-Length가 상한을 넘으면 본문을 읽지 않는다."""
+        from dashboard.components.image_slider import _IMG_MAX_BYTES, _read_body
+
+        resp = _fake_response([], content_length=str(_IMG_MAX_BYTES + 1))
+
+        assert _read_body(resp, "https://example.com/a.jpg") is None
+        resp.iter_content.assert_not_called()
+
+    def test_read_body_rejects_streamed_oversize(self):
+        """Content-Length 없이 누적 크기가 상한을 넘으면 중단한다."""
+        from dashboard.components.image_slider import _IMG_MAX_BYTES, _read_body
+
+        consumed: list[int] = []
+
+        def _chunks():
+            yield b"\x89PNG\r\n\x1a\n" + b"\x00" * (_IMG_MAX_BYTES - 8)
+            consumed.append(1)
+            yield b"\x00"
+            consumed.append(2)
+            yield b"\x00"
+
+        resp = MagicMock()
+        resp.headers = {}
+        resp.iter_content.return_value = _chunks()
+
+        assert _read_body(resp, "https://example.com/a.png") is None
+        # 상한을 넘긴 청크 직후 중단 — 이후 청크는 요청하지 않음
+        assert consumed == [1]
+
+
 # =====================================================================
 # Main
 # =====================================================================
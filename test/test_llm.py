@@ -16,6 +16,9 @@ test_llm_output/ 에 txt로 저장합니다.
 import logging
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # 프로젝트 루트를 sys.path에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -276,5 +279,69 @@ def run() -> None:
     logger.info("완료. 결과 위치: %s", OUTPUT_DIR)
 
 
+# ---------------------------------------------------------------------------
+# 단위 테스트: call_ollama_stream NDJSON 처리 (Mock 기반, Ollama 불필요)
+#   python -m pytest test/test_llm.py -v
+# ---------------------------------------------------------------------------
+
+def _fake_stream_response(lines: list[bytes]) -> MagicMock:
+    """iter_lines가 NDJSON 줄을 순서대로 내보내는 가짜 스트리밍 Response."""
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.__exit__.return_value = False
+    resp.iter_lines.return_value = iter(lines)
+    return resp
+
+
+class TestCallOllamaStream:
+    """call_ollama_stream 검증."""
+
+    def test_yields_response_chunks_in_order(self):
+        """NDJSON 줄마다 response 조각을 순서대로 내보내고 빈 줄은 건너뛴다."""
+        from ai_worker.script import client
+
+        resp = _fake_stream_response([
+            '{"response": "안녕", "done": false}'.encode(),
+            b"",
+            '{"response": "하세요", "done": false}'.encode(),
+            b'{"response": "", "done": true}',
+        ])
+        with patch.object(client._ollama_session, "post", return_value=resp) as mock_post:
+            assert list(client.call_ollama_stream("p", max_tokens=64)) == ["안녕", "하세요"]
+
+        _, kwargs = mock_post.call_args
+        assert kwargs["stream"] is True
+        assert kwargs["json"]["stream"] is True
+        assert kwargs["json"]["options"]["num_predict"] == 64
+
+    def test_stops_at_done(self):
+        """done 줄 이후의 NDJSON은 읽지 않는다."""
+        from ai_worker.script import client
+
+        trailing = b'{"response": "X", "done": false}'
+        resp = _fake_stream_response([
+            b'{"response": "a", "done": false}',
+            b'{"response": "b", "done": true}',
+            trailing,
+        ])
+        with patch.object(client._ollama_session, "post", return_value=resp):
+            assert list(client.call_ollama_stream("p")) == ["a", "b"]
+        assert next(resp.iter_lines.return_value) == trailing
+
+    def test_error_chunk_raises(self):
+        """스트림 중 error 필드가 오면 ConnectionError로 중단한다."""
+        from ai_worker.script import client
+
+        resp = _fake_stream_response([
+            b'{"response": "a", "done": false}',
+            b'{"error": "model not found"}',
+        ])
+        with patch.object(client._ollama_session, "post", return_value=resp):
+            gen = client.call_ollama_stream("p")
+            assert next(gen) == "a"
+            with pytest.raises(ConnectionError, match="model not found"):
+                next(gen)
+
+
 if __name__ == "__main__":
     run()
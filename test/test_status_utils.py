@@ -0,0 +1,79 @@
+"""대시보드 상태 변경 헬퍼 단위 테스트 (in-memory SQLite).
+
+실행 방법:
+  python -m pytest test/test_status_utils.py -v
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from db.models import Post, PostStatus
+
+
+@pytest.fixture
+def scoped(monkeypatch):
+    """posts 테이블만 만든 in-memory SQLite에 ScopedSession을 연결한다."""
+    from dashboard.components import status_utils
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Post.__table__.create(engine)
+    factory = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+    monkeypatch.setattr(status_utils, "ScopedSession", factory)
+
+    with factory() as s:
+        s.add_all([
+            Post(id=i, site_code="test", origin_id=str(i), title=f"post {i}",
+                 status=PostStatus.COLLECTED)
+            for i in (1, 2, 3, 4)
+        ])
+        s.commit()
+    factory.remove()
+    yield factory
+    factory.remove()
+    engine.dispose()
+
+
+class TestBatchUpdateStatusMap:
+    """batch_update_status_map 검증."""
+
+    def test_mixed_targets(self, scoped):
+        """게시글별 목표 상태가 Enum 값으로 저장되고 변경 행 수를 반환한다."""
+        from dashboard.components.status_utils import batch_update_status_map
+
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mapping = {
+            1: PostStatus.APPROVED,
+            2: PostStatus.DECLINED,
+            3: PostStatus.EDITING,
+        }
+
+        assert batch_update_status_map(mapping, updated_at=ts) == 3
+
+        with scoped() as s:
+            stored = {p.id: p for p in s.query(Post).order_by(Post.id)}
+        assert {pid: p.status for pid, p in stored.items()} == {
+            1: PostStatus.APPROVED,
+            2: PostStatus.DECLINED,
+            3: PostStatus.EDITING,
+            4: PostStatus.COLLECTED,
+        }
+        assert all(stored[pid].updated_at == ts.replace(tzinfo=None) for pid in mapping)
+
+    def test_missing_ids_not_counted(self, scoped):
+        """존재하지 않는 id는 변경 행 수에 포함되지 않는다."""
+        from dashboard.components.status_utils import batch_update_status_map
+
+        assert batch_update_status_map({4: PostStatus.APPROVED, 99: PostStatus.DECLINED}) == 1
+
+    def test_empty_mapping(self, scoped):
+        """빈 매핑은 DB를 건드리지 않고 0을 반환한다."""
+        from dashboard.components.status_utils import batch_update_status_map
+
+        assert batch_update_status_map({}) == 0
@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 _MAX_RETRIES = 3
 _RETRY_BACKOFF = 2
 
+# videos.list 1회 요청당 최대 id 개수 (YouTube Data API 제한)
+_VIDEOS_LIST_MAX_IDS = 50
+
 
 @UploaderRegistry.register("youtube")
 class YouTubeUploader(BaseUploader):
@@ -172,6 +175,44 @@ class YouTubeUploader(BaseUploader):
             logger.warning("Analytics 수집 실패 video_id=%s: %s", video_id, exc)
             return None
 
+    def fetch_analytics_bulk(self, video_ids: list[str]) -> dict[str, dict]:
+        """여러 영상의 통계를 videos.list 일괄 조회로 가져온다 (요청당 최대 50개).
+
+        영상마다 fetch_analytics()를 호출하는 대신 id를 콤마로 묶어
+        50개 단위로 1회씩만 요청한다.
+
+        Returns:
+            {video_id: {"views": int, "likes": int, "comments": int}}
+            — 통계가 없거나 청크 조회에 실패한 영상은 포함되지 않는다.
+
+        Raises:
+            Exception: 서비스 초기화(인증) 실패 — 호출부에서 전체 실패로 처리한다.
+        """
+        result: dict[str, dict] = {}
+        if not video_ids:
+            return result
+        svc = self._get_service()
+
+        for i in range(0, len(video_ids), _VIDEOS_LIST_MAX_IDS):
+            chunk = video_ids[i:i + _VIDEOS_LIST_MAX_IDS]
+            try:
+                resp = svc.videos().list(
+                    part="statistics",
+                    id=",".join(chunk),
+                    maxResults=_VIDEOS_LIST_MAX_IDS,
+                ).execute()
+            except Exception as exc:
+                logger.warning("Analytics 일괄 수집 실패 (%d건): %s", len(chunk), exc)
+                continue
+            for item in resp.get("items", []):
+                stats = item.get("statistics", {})
+                result[item["id"]] = {
+                    "views": int(stats.get("viewCount", 0)),
+                    "likes": int(stats.get("likeCount", 0)),
+                    "comments": int(stats.get("commentCount", 0)),
+                }
+        return result
+
     @staticmethod
     def _resumable_upload(request) -> dict:
         """resumable upload 실행 (재시도 포함)."""